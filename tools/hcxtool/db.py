@@ -24,6 +24,9 @@ def init_hcxtool_schema(conn: sqlite3.Connection) -> None:
 );
     """
     execute_query(conn, query)
+    # UNIQUE(bssid, ssid) leads with bssid, so lookups by ssid alone need their own index;
+    # including key makes the founds lookup (ssid -> key) an index-only read
+    execute_query(conn, "CREATE INDEX IF NOT EXISTS hcxtool_ssid_key_idx ON hcxtool(ssid, key)")
 
 def insert_hcxtool_results(conn: sqlite3.Connection,
                           date: str,
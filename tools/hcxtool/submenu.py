@@ -90,10 +90,7 @@ class HcxToolSubmenu(BaseSubmenu):
                 parent_win.addstr(row + 1, 0, "Press any key to retry upload menu, or 0 to go back...")
                 parent_win.refresh()
                 key = parent_win.getch()
-                try:
-                    if chr(key) == "0":
-                        return
-                except Exception:
+                if key in (ord("0"), -1):  # -1 (ERR) also cancels
                     return
             else:
                 file_path = Path(results_dir) / selection
@@ -108,10 +105,7 @@ class HcxToolSubmenu(BaseSubmenu):
                 parent_win.addstr(2, 0, "Press any key to retry upload menu, or 0 to go back...")
                 parent_win.refresh()
                 key = parent_win.getch()
-                try:
-                    if chr(key) == "0":
-                        return
-                except Exception:
+                if key in (ord("0"), -1):  # -1 (ERR) also cancels
                     return
 
     def download(self, parent_win) -> None:
@@ -5,6 +5,8 @@ from database.db_manager import get_db_connection, fetch_all
 
 logger = logging.getLogger(__name__)
 
+SQL_PARAM_CHUNK = 900  # bound parameters per IN (...) query
+
 ##################################
 ##### GET FROM HCXTOOL TABLE #####
 ##################################
@@ -33,6 +35,38 @@ def get_founds_ssid_and_key(basedir: Path) -> list:
     finally:
         conn.close()
 
+def get_founds_for_ssids(basedir: Path, ssids) -> list:
+    """
+    Returns a list of tuples (ssid, key) from the hcxtool table for only the given SSIDs
+    (e.g. those just seen in a scan) where key is non-empty, so SQLite does the intersection
+    through hcxtool_ssid_key_idx instead of the whole table being fetched and filtered in Python.
+    """
+    ssids = list(dict.fromkeys(ssid for ssid in ssids if ssid))
+    if not ssids:
+        return []
+    conn = get_db_connection(basedir)
+    try:
+        results = []
+        # stay below SQLite's default limit of 999 bound parameters per statement
+        for start in range(0, len(ssids), SQL_PARAM_CHUNK):
+            chunk = ssids[start:start + SQL_PARAM_CHUNK]
+            query = f"""
+                SELECT ssid, key
+                FROM hcxtool
+                WHERE ssid IN ({",".join("?" * len(chunk))}) AND key IS NOT NULL AND key != ''
+            """
+            try:
+                results.extend(fetch_all(conn, query, tuple(chunk)))
+            except sqlite3.OperationalError as e:
+                if "no such table: hcxtool" in str(e):
+                    from tools.hcxtool.db import init_hcxtool_schema
+                    init_hcxtool_schema(conn)
+                    return []
+                raise
+        return results
+    finally:
+        conn.close()
+
 def get_founds_bssid_ssid_and_key(basedir: Path) -> list:
     """
     Opens a database connection using the given basedir and returns a list of tuples
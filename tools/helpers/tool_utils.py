@@ -8,6 +8,7 @@ import netifaces
 import ipaddress
 import subprocess
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Tuple
 from datetime import datetime, timedelta
 
@@ -50,7 +51,7 @@ def update_yaml_value(config_path: Path, key_path: list, new_value) -> None:
         with config_path.open("r") as f:
             config = yaml.safe_load(f) or {}
     except Exception as e:
-        logger.error(f"Failed to load configuration file {config_path}: {e}")
+        logger.error("Failed to load configuration file %s: %s", config_path, e)
         raise
 
     sub_config = config
@@ -64,9 +65,9 @@ def update_yaml_value(config_path: Path, key_path: list, new_value) -> None:
     try:
         with config_path.open("w") as f:
             yaml.dump(config, f, default_flow_style=False)
-        logger.info(f"Updated {'.'.join(key_path)} to {new_value} in {config_path}")
+        logger.info("Updated %s to %s in %s", ".".join(key_path), new_value, config_path)
     except Exception as e:
-        logger.error(f"Failed to write updated configuration to {config_path}: {e}")
+        logger.error("Failed to write updated configuration to %s: %s", config_path, e)
         raise
 
 def format_scan_display(scan: dict) -> str:
@@ -97,6 +98,9 @@ def format_scan_display(scan: dict) -> str:
 #######################################################
 ### OS/HARDWARE/NETWORK INFORMATION GATHERING UTILS ###
 #######################################################
+NM_DBUS_SERVICE = "org.freedesktop.NetworkManager"
+NM_DBUS_WIRELESS = "org.freedesktop.NetworkManager.Device.Wireless"
+
 def wait_for_association(interface, timeout=30):
     start = time.time()
     while time.time() - start < timeout:
@@ -115,7 +119,7 @@ def get_all_connected_interfaces(logger: logging.Logger) -> List[str]:
     try:
         output = subprocess.check_output(cmd, stderr=subprocess.DEVNULL, text=True)
     except Exception as e:
-        logger.error(f"Error retrieving connected interfaces: {e}")
+        logger.error("Error retrieving connected interfaces: %s", e)
         return []
     connected = []
     for line in output.splitlines():
@@ -124,7 +128,7 @@ def get_all_connected_interfaces(logger: logging.Logger) -> List[str]:
             device, state = parts[0].strip(), parts[1].strip()
             if state.lower() == "connected":
                 connected.append(device)
-    logger.debug(f"Connected interfaces: {connected}")
+    logger.debug("Connected interfaces: %s", connected)
     return connected
 
 def get_available_wireless_interfaces(logger: logging.Logger) -> List[str]:
@@ -136,7 +140,7 @@ def get_available_wireless_interfaces(logger: logging.Logger) -> List[str]:
     try:
         output = subprocess.check_output(cmd, stderr=subprocess.DEVNULL, text=True)
     except Exception as e:
-        logger.error(f"Error retrieving interfaces: {e}")
+        logger.error("Error retrieving interfaces: %s", e)
         return []
     available = []
     for line in output.splitlines():
@@ -146,7 +150,7 @@ def get_available_wireless_interfaces(logger: logging.Logger) -> List[str]:
             # accept any managed Wi-Fi iface
             if dev_type.lower() == "wifi" and state.lower() != "unmanaged":
                 available.append(device)
-    logger.debug(f"Available wireless interfaces: {available}")
+    logger.debug("Available wireless interfaces: %s", available)
     return available
 
 def get_available_ethernet_interfaces(logger: logging.Logger) -> List[str]:
@@ -158,7 +162,7 @@ def get_available_ethernet_interfaces(logger: logging.Logger) -> List[str]:
     try:
         output = subprocess.check_output(cmd, stderr=subprocess.DEVNULL, text=True)
     except Exception as e:
-        logger.error(f"Error retrieving ethernet interfaces: {e}")
+        logger.error("Error retrieving ethernet interfaces: %s", e)
         return []
     available = []
     for line in output.splitlines():
@@ -168,27 +172,171 @@ def get_available_ethernet_interfaces(logger: logging.Logger) -> List[str]:
             # Accept ethernet devices that are not marked as unmanaged.
             if dev_type.lower() == "ethernet" and state.lower() != "unmanaged":
                 available.append(device)
-    logger.debug(f"Available ethernet interfaces: {available}")
+    logger.debug("Available ethernet interfaces: %s", available)
     return available
 
-def get_wifi_networks(interface: str, logger: logging.Logger) -> List[Tuple[str, str]]:
+def get_wifi_networks(interface: str, logger: logging.Logger, rescan: str = "auto",
+                      with_signal: bool = False) -> List[Tuple]:
     """
     Uses nmcli to scan for available networks on the specified interface.
+    Returns a list of tuples in the form (SSID, SECURITY), or (SSID, SECURITY, SIGNAL)
+    with with_signal=True (SIGNAL is nmcli's 0-100 strength, 0 if unparsable).
+
+    :param rescan: nmcli --rescan mode: "auto" (nmcli decides), "yes" (force a new scan)
+                   or "no" (only return NetworkManager's cached results)
+    """
+    fields = "SSID,SECURITY,SIGNAL" if with_signal else "SSID,SECURITY"
+    cmd = ["nmcli", "-t", "-f", fields, "device", "wifi", "list", "ifname", interface,
+           "--rescan", rescan]
+    networks = []
+    try:
+        # parse terse lines as nmcli emits them instead of buffering the whole listing
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True) as proc:
+            for line in proc.stdout:
+                parts = split_nmcli_terse(line.rstrip("\n"))
+                if len(parts) < 2:
+                    continue
+                ssid = parts[0].strip()
+                security = parts[1].strip()
+                if not with_signal:
+                    networks.append((ssid, security))
+                    continue
+                try:
+                    signal = int(parts[-1])
+                except ValueError:
+                    signal = 0
+                networks.append((ssid, security, signal))
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+    except Exception as e:
+        logger.error("nmcli scan failed: %s", e)
+        return []
+    return networks
+
+def split_nmcli_terse(line: str) -> List[str]:
+    """
+    Splits one line of `nmcli -t` output into its fields. nmcli escapes ':' and '\\'
+    inside values with a backslash (e.g. an SSID "a:b" is printed as "a\\:b"), so a plain
+    split(':') would cut such SSIDs apart.
+    """
+    fields, current = [], []
+    chars = iter(line)
+    for ch in chars:
+        if ch == "\\":
+            current.append(next(chars, ""))
+        elif ch == ":":
+            fields.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+    fields.append("".join(current))
+    return fields
+
+def get_wifi_networks_multi(interfaces: List[str], logger: logging.Logger,
+                            rescan: str = "auto") -> List[Tuple[str, str]]:
+    """
+    Scans all the given interfaces concurrently (one nmcli per interface), so the total
+    time is that of the slowest adapter instead of the sum of all of them.
+    SSIDs seen on several interfaces are merged, keeping the entry with the strongest signal.
+    Returns a list of (SSID, SECURITY) tuples, strongest first.
+    """
+    best = {}  # SSID -> (SECURITY, SIGNAL)
+    with ThreadPoolExecutor(max_workers=max(1, len(interfaces))) as executor:
+        futures = [executor.submit(get_wifi_networks, iface, logger, rescan, True) for iface in interfaces]
+        for future in as_completed(futures):
+            for ssid, security, signal in future.result():
+                if ssid not in best or signal > best[ssid][1]:
+                    best[ssid] = (security, signal)
+    ranked = sorted(best.items(), key=lambda item: item[1][1], reverse=True)
+    return [(ssid, security) for ssid, (security, _) in ranked]
+
+def _nm_wifi_last_scan(device_path: str):
+    """
+    Reads the LastScan property (CLOCK_BOOTTIME ms, -1 if never scanned) of a NetworkManager
+    wireless device over D-Bus via busctl. Returns None if it cannot be read.
+    """
+    cmd = ["busctl", "get-property", NM_DBUS_SERVICE, device_path, NM_DBUS_WIRELESS, "LastScan"]
+    try:
+        output = subprocess.check_output(cmd, stderr=subprocess.DEVNULL, text=True)
+        return int(output.split()[1])  # e.g. "x 1234567"
+    except (OSError, subprocess.CalledProcessError, IndexError, ValueError):
+        return None
+
+def rescan_wifi_networks(interface: str, logger: logging.Logger, timeout: float = 30,
+                         poll_interval: float = 0.2) -> List[Tuple[str, str]]:
+    """
+    Triggers `nmcli device wifi rescan` without waiting on it, then polls the device's
+    LastScan D-Bus property until NetworkManager reports a newer scan and reads the
+    results with `--rescan no`. Falls back to a blocking `--rescan yes` list if the
+    D-Bus property is not readable (e.g. no busctl).
     Returns a list of tuples in the form (SSID, SECURITY).
     """
-    cmd = ["nmcli", "-t", "-f", "SSID,SECURITY", "device", "wifi", "list", "ifname", interface]
+    device_path = None
     try:
-        output = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
+        output = subprocess.check_output(
+            ["busctl", "call", NM_DBUS_SERVICE, "/org/freedesktop/NetworkManager",
+             NM_DBUS_SERVICE, "GetDeviceByIpIface", "s", interface],
+            stderr=subprocess.DEVNULL, text=True
+        )
+        device_path = output.split()[1].strip('"')  # e.g. o "/org/freedesktop/NetworkManager/Devices/3"
+    except (OSError, subprocess.CalledProcessError, IndexError):
+        pass
+    last_scan = _nm_wifi_last_scan(device_path) if device_path else None
+    if last_scan is None:
+        logger.debug("LastScan unavailable for %s; using a blocking nmcli rescan.", interface)
+        return get_wifi_networks(interface, logger, rescan="yes")
+
+    proc = subprocess.Popen(["nmcli", "device", "wifi", "rescan", "ifname", interface],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(poll_interval)
+            # a refused rescan (device busy/unavailable) never moves LastScan; stop waiting for it
+            if proc.poll():
+                logger.warning("nmcli rescan on %s failed (exit %s); using NetworkManager's last results.",
+                               interface, proc.returncode)
+                break
+            current = _nm_wifi_last_scan(device_path)
+            if current is not None and current != last_scan:
+                break
+        else:
+            logger.warning("No new scan on %s after %ss; using NetworkManager's last results.", interface, timeout)
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+    return get_wifi_networks(interface, logger, rescan="no")
+
+def scan_wifi_frequencies(interface: str, freqs: List[int], logger: logging.Logger) -> List[Tuple[str, str]]:
+    """
+    Runs one active `iw dev <interface> scan freq <MHz> ...` bounded to the given
+    frequencies, which takes tens of milliseconds per channel instead of seconds for a
+    full-band sweep. SECURITY is "WPA" for networks advertising an RSN/WPA element or the
+    Privacy capability, "--" otherwise (matching nmcli's notation for open networks).
+    Returns a list of (SSID, SECURITY) tuples, empty if the scan failed (e.g. not root,
+    or the device is busy).
+    """
+    cmd = ["iw", "dev", interface, "scan", "freq"] + [str(f) for f in freqs]
+    try:
+        output = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True, timeout=10)
     except Exception as e:
-        logger.error(f"nmcli scan failed: {e}")
+        logger.debug("iw frequency scan failed on %s: %s", interface, e)
         return []
     networks = []
+    ssid, secured = None, False
     for line in output.splitlines():
-        parts = line.split(":")
-        if len(parts) >= 2:
-            ssid = parts[0].strip()
-            security = parts[1].strip()
-            networks.append((ssid, security))
+        stripped = line.strip()
+        if line.startswith("BSS "):
+            if ssid:
+                networks.append((ssid, "WPA" if secured else "--"))
+            ssid, secured = None, False
+        elif stripped.startswith("SSID: "):
+            ssid = stripped[6:]
+        elif stripped.startswith(("RSN:", "WPA:")) or (stripped.startswith("capability:") and "Privacy" in stripped):
+            secured = True
+    if ssid:
+        networks.append((ssid, "WPA" if secured else "--"))
     return networks
 
 def get_network_from_interface(interface: str) -> str:
@@ -267,8 +415,8 @@ def parse_nmcli_ssid_bssid(output: str) -> list:
         if len(parts) >= 2:
             ssid, bssid = parts[0], parts[1]
             results.append({"ssid": ssid, "bssid": bssid})
-            logger.debug(f"parsed ssid: {ssid} & parsed bssid:{bssid}")
-    logger.debug(f"parsed results: {results}")
+            logger.debug("parsed ssid: %s & parsed bssid:%s", ssid, bssid)
+    logger.debug("parsed results: %s", results)
     return results
 
 def get_interface_mode(interface: str, logger: logging.Logger) -> str:
@@ -292,7 +440,7 @@ def get_interface_mode(interface: str, logger: logging.Logger) -> str:
                 if len(parts) >= 2:
                     return parts[1].lower()
     except Exception as e:
-        logger.error(f"Error getting mode for interface {interface}: {e}")
+        logger.error("Error getting mode for interface %s: %s", interface, e)
     return ""
 
 def switch_interface_to_managed(interface: str, logger: logging.Logger) -> bool:
@@ -311,10 +459,10 @@ def switch_interface_to_managed(interface: str, logger: logging.Logger) -> bool:
                               stderr=subprocess.DEVNULL)
         subprocess.check_call(["ip", "link", "set", interface, "up"],
                               stderr=subprocess.DEVNULL)
-        logger.info(f"Interface {interface} switched to managed mode.")
+        logger.info("Interface %s switched to managed mode.", interface)
         return True
     except subprocess.CalledProcessError as e:
-        logger.error(f"Error switching interface {interface} to managed mode: {e}")
+        logger.error("Error switching interface %s to managed mode: %s", interface, e)
     return False
 
 def switch_interface_to_monitor(interface: str, logger: logging.Logger) -> bool:
@@ -330,10 +478,10 @@ def switch_interface_to_monitor(interface: str, logger: logging.Logger) -> bool:
         subprocess.check_call(["ip", "link", "set", interface, "down"], stderr=subprocess.DEVNULL)
         subprocess.check_call(["iw", "dev", interface, "set", "type", "monitor"], stderr=subprocess.DEVNULL)
         subprocess.check_call(["ip", "link", "set", interface, "up"], stderr=subprocess.DEVNULL)
-        logger.info(f"Interface {interface} switched to monitor mode.")
+        logger.info("Interface %s switched to monitor mode.", interface)
         return True
     except subprocess.CalledProcessError as e:
-        logger.error(f"Error switching interface {interface} to monitor mode: {e}")
+        logger.error("Error switching interface %s to monitor mode: %s", interface, e)
     return False
 
 
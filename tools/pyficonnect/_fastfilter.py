@@ -0,0 +1,174 @@
+import ctypes
+import socket
+import struct
+from typing import Iterable, Optional, Tuple
+
+###############################
+##### RAW FRAME FILTERING #####
+###############################
+# offsets are relative to the start of the 802.11 header (after radiotap)
+DOT11_FC_BEACON = 0x80
+DOT11_FC_PROBE_RESP = 0x50
+DOT11_FC_PROBE_REQ = 0x40
+DOT11_ADDR2_OFFSET = 10
+DOT11_MGMT_HDR_LEN = 24
+BEACON_FIXED_PARAMS_LEN = 12  # timestamp (8) + beacon interval (2) + capabilities (2), same for probe responses
+IE_SSID = 0
+IE_RATES = 1
+RADIOTAP_MIN_HDR = b"\x00\x00\x08\x00\x00\x00\x00\x00"  # version 0, len 8, no fields
+
+
+def bssid_to_bytes(bssid: str) -> bytes:
+    """
+    Converts a MAC string (any separator/case) into its raw 6-byte form.
+    """
+    return bytes.fromhex("".join(c for c in bssid if c.isalnum()))
+
+
+def bytes_to_bssid(raw: bytes) -> str:
+    """
+    Converts a raw 6-byte MAC into the AA:BB:CC:DD:EE:FF form used by normalize_mac.
+    """
+    return raw.hex(":").upper()
+
+
+def build_probe_request(src_mac: bytes) -> bytes:
+    """
+    Builds a broadcast (wildcard SSID) probe request once, as raw bytes ready to be written
+    to a monitor interface: minimal radiotap header + 802.11 mgmt header + SSID/rates IEs.
+
+    :param src_mac: Raw 6-byte transmitter address.
+    """
+    broadcast = b"\xff" * 6
+    return (
+        RADIOTAP_MIN_HDR
+        + bytes((DOT11_FC_PROBE_REQ, 0, 0, 0))  # frame control, duration
+        + broadcast + src_mac + broadcast
+        + b"\x00\x00"  # sequence control, filled in by the driver
+        + bytes((IE_SSID, 0))
+        + bytes((IE_RATES, 4)) + b"\x82\x84\x8b\x96"  # 1, 2, 5.5, 11 Mbps (basic)
+    )
+
+
+def filter_beacon(buf: bytes, bssids) -> Optional[Tuple[int, bytes]]:
+    """
+    Reads the radiotap length, frame control and transmitter address straight from the
+    captured frame bytes without dissecting the packet. The SSID is left to frame_ssid,
+    so callers only walk the IEs for frames they actually act on.
+
+    :param buf: Raw frame as captured on a monitor interface (radiotap + 802.11).
+    :param bssids: Set of 6-byte BSSIDs we are interested in.
+    :return: (dot11_offset, bssid_bytes) for a beacon/probe response from a wanted BSSID, otherwise None.
+    """
+    buf_len = len(buf)
+    if buf_len < 4:
+        return None
+    dot11 = buf[2] | (buf[3] << 8)  # radiotap it_len is little endian
+    if buf_len < dot11 + DOT11_MGMT_HDR_LEN:
+        return None
+    # the kernel filter already guarantees this on the rx ring; kept for the sniff() fallback
+    fc = buf[dot11]
+    if fc != DOT11_FC_BEACON and fc != DOT11_FC_PROBE_RESP:
+        return None
+
+    bssid = buf[dot11 + DOT11_ADDR2_OFFSET:dot11 + DOT11_ADDR2_OFFSET + 6]
+    if bssid not in bssids:
+        return None
+    return dot11, bytes(bssid)
+
+
+def frame_ssid(buf: bytes, dot11: int) -> bytes:
+    """
+    Walks the tagged parameters of a beacon/probe response for the SSID element.
+
+    :param buf: Raw frame accepted by filter_beacon.
+    :param dot11: Offset of the 802.11 header returned by filter_beacon.
+    :return: Raw SSID bytes, b"" if the frame carries none.
+    """
+    buf_len = len(buf)
+    pos = dot11 + DOT11_MGMT_HDR_LEN + BEACON_FIXED_PARAMS_LEN
+    while pos + 2 <= buf_len:
+        ie_id = buf[pos]
+        ie_len = buf[pos + 1]
+        if ie_id == IE_SSID:
+            return bytes(buf[pos + 2:pos + 2 + ie_len])
+        pos += 2 + ie_len
+    return b""
+
+
+###################################
+##### KERNEL SOCKET FILTERING #####
+###################################
+SO_ATTACH_FILTER = 26
+SO_DETACH_FILTER = 27
+BPF_SNAPLEN = 0x40000
+BPF_MAX_BSSIDS = 40  # keeps every jump offset within the 8-bit cBPF jt/jf range
+
+# classic BPF opcodes used below
+BPF_LDB_ABS = 0x30  # A = pkt[k]
+BPF_LDB_IND = 0x50  # A = pkt[X + k]
+BPF_LDH_IND = 0x48  # A = pkt[X + k : X + k + 2]
+BPF_LDW_IND = 0x40  # A = pkt[X + k : X + k + 4]
+BPF_LSH_K = 0x64    # A <<= k
+BPF_OR_X = 0x4c     # A |= X
+BPF_TAX = 0x07      # X = A
+BPF_JEQ_K = 0x15    # pc += (A == k) ? jt : jf
+BPF_RET_K = 0x06    # return k
+
+
+def build_beacon_bpf(bssids: Iterable[bytes] = ()) -> bytes:
+    """
+    Hand-assembles a classic BPF program (packed struct sock_filter[]) that only passes
+    beacons and probe responses, optionally restricted to the given BSSIDs.
+
+    :param bssids: 6-byte BSSIDs to accept; empty (or more than BPF_MAX_BSSIDS) only checks the frame type.
+    :return: Packed filter instructions for attach_bpf_filter.
+    """
+    bssids = list(bssids)
+    if len(bssids) > BPF_MAX_BSSIDS:
+        bssids = []
+
+    n = len(bssids)
+    prog = [
+        # X = radiotap it_len (little endian u16 at offset 2)
+        (BPF_LDB_ABS, 0, 0, 3),
+        (BPF_LSH_K, 0, 0, 8),
+        (BPF_TAX, 0, 0, 0),
+        (BPF_LDB_ABS, 0, 0, 2),
+        (BPF_OR_X, 0, 0, 0),
+        (BPF_TAX, 0, 0, 0),
+        # frame control must be a beacon or probe response, otherwise jump to the reject at the end
+        (BPF_LDB_IND, 0, 0, 0),
+        (BPF_JEQ_K, 1, 0, DOT11_FC_BEACON),
+        (BPF_JEQ_K, 0, 4 * n if n else 1, DOT11_FC_PROBE_RESP),
+    ]
+    for i, bssid in enumerate(bssids):
+        # compare addr2 as a 4 + 2 byte pair; match jumps to accept, miss falls to next pair
+        prog.append((BPF_LDW_IND, 0, 0, DOT11_ADDR2_OFFSET))
+        prog.append((BPF_JEQ_K, 0, 2, int.from_bytes(bssid[:4], "big")))
+        prog.append((BPF_LDH_IND, 0, 0, DOT11_ADDR2_OFFSET + 4))
+        prog.append((BPF_JEQ_K, 4 * (n - i) - 3, 0, int.from_bytes(bssid[4:6], "big")))
+    if n:
+        prog.append((BPF_RET_K, 0, 0, 0))
+        prog.append((BPF_RET_K, 0, 0, BPF_SNAPLEN))
+    else:
+        prog.append((BPF_RET_K, 0, 0, BPF_SNAPLEN))
+        prog.append((BPF_RET_K, 0, 0, 0))
+    return b"".join(struct.pack("HBBI", *ins) for ins in prog)
+
+
+def attach_bpf_filter(sock: socket.socket, program: bytes) -> None:
+    """
+    Attaches a program from build_beacon_bpf to a raw packet socket (SO_ATTACH_FILTER),
+    so non-matching frames are dropped in the kernel before they are copied to userspace.
+    """
+    buf = ctypes.create_string_buffer(program)
+    fprog = struct.pack("HL", len(program) // 8, ctypes.addressof(buf))
+    sock.setsockopt(socket.SOL_SOCKET, SO_ATTACH_FILTER, fprog)
+
+
+def detach_bpf_filter(sock: socket.socket) -> None:
+    """
+    Removes a filter previously attached with attach_bpf_filter (SO_DETACH_FILTER).
+    """
+    sock.setsockopt(socket.SOL_SOCKET, SO_DETACH_FILTER, 0)
@@ -0,0 +1,111 @@
+import os
+import errno
+import socket
+import struct
+
+##############################
+##### NL80211 NETLINK IO #####
+##############################
+NETLINK_GENERIC = 16
+NLM_F_REQUEST = 0x1
+NLM_F_ACK = 0x4
+NLMSG_ERROR = 0x2
+GENL_ID_CTRL = 0x10
+CTRL_CMD_GETFAMILY = 3
+CTRL_ATTR_FAMILY_ID = 1
+CTRL_ATTR_FAMILY_NAME = 2
+NL80211_CMD_SET_WIPHY = 2  # what `iw dev <iface> set channel` sends
+NL80211_ATTR_IFINDEX = 3
+NL80211_ATTR_WIPHY_FREQ = 38
+
+NLMSGHDR = struct.Struct("=IHHII")  # len, type, flags, seq, pid
+GENLMSGHDR = struct.Struct("=BBH")  # cmd, version, reserved
+NLATTR = struct.Struct("=HH")       # len, type
+
+
+def channel_to_freq(channel: int) -> int:
+    """
+    Converts a 2.4 GHz or 5 GHz channel number into its center frequency in MHz.
+    """
+    if channel == 14:
+        return 2484
+    if channel < 14:
+        return 2407 + 5 * channel
+    return 5000 + 5 * channel
+
+
+def _nlattr(attr_type: int, payload: bytes) -> bytes:
+    length = NLATTR.size + len(payload)
+    return NLATTR.pack(length, attr_type) + payload + b"\0" * (-length % 4)
+
+
+def _parse_attrs(data: bytes) -> dict:
+    attrs = {}
+    pos = 0
+    while pos + NLATTR.size <= len(data):
+        length, attr_type = NLATTR.unpack_from(data, pos)
+        if length < NLATTR.size:
+            break
+        attrs[attr_type & 0x3fff] = data[pos + NLATTR.size:pos + length]
+        pos += (length + 3) & ~3
+    return attrs
+
+
+class Nl80211:
+    """
+    A persistent generic netlink socket for nl80211, so changing channel is one
+    sendmsg/recv round trip instead of a fork/exec of `iw`.
+    """
+
+    def __init__(self) -> None:
+        self.sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_GENERIC)
+        try:
+            self.sock.bind((0, 0))
+            self.sock.settimeout(1)
+            self.seq = 0
+            reply = self._request(GENL_ID_CTRL, CTRL_CMD_GETFAMILY,
+                                  _nlattr(CTRL_ATTR_FAMILY_NAME, b"nl80211\0"))
+            family_id = _parse_attrs(reply).get(CTRL_ATTR_FAMILY_ID)
+            if family_id is None:
+                raise OSError(errno.ENOENT, "nl80211 family not found")
+            self.family_id = struct.unpack("=H", family_id[:2])[0]
+        except OSError:
+            self.sock.close()
+            raise
+
+    def _request(self, msg_type: int, cmd: int, attrs: bytes) -> bytes:
+        """
+        Sends one generic netlink request and waits for its ack.
+        Returns the attribute payload of the reply (if any), raises OSError on a netlink error.
+        """
+        self.seq += 1
+        body = GENLMSGHDR.pack(cmd, 1, 0) + attrs
+        self.sock.send(NLMSGHDR.pack(NLMSGHDR.size + len(body), msg_type,
+                                     NLM_F_REQUEST | NLM_F_ACK, self.seq, 0) + body)
+        payload = b""
+        while True:
+            data = self.sock.recv(65536)
+            pos = 0
+            while pos + NLMSGHDR.size <= len(data):
+                length, reply_type, _, seq, _ = NLMSGHDR.unpack_from(data, pos)
+                if length < NLMSGHDR.size:
+                    return payload
+                if seq == self.seq:
+                    if reply_type == NLMSG_ERROR:
+                        error = struct.unpack_from("=i", data, pos + NLMSGHDR.size)[0]
+                        if error:
+                            raise OSError(-error, os.strerror(-error))
+                        return payload
+                    payload = data[pos + NLMSGHDR.size + GENLMSGHDR.size:pos + length]
+                pos += (length + 3) & ~3
+
+    def set_channel(self, ifindex: int, channel: int) -> None:
+        """
+        Tunes the interface with the given index to channel (20 MHz, no HT).
+        """
+        self._request(self.family_id, NL80211_CMD_SET_WIPHY,
+                      _nlattr(NL80211_ATTR_IFINDEX, struct.pack("=I", ifindex)) +
+                      _nlattr(NL80211_ATTR_WIPHY_FREQ, struct.pack("=I", channel_to_freq(channel))))
+
+    def close(self) -> None:
+        self.sock.close()
@@ -67,9 +67,10 @@ def format_pyficonnect_networks(rows: list) -> dict:
         try:
             bssid, ssid, key = row
             norm_bssid = normalize_mac(bssid)
-            logger.debug(f"Formatting network: raw BSSID {bssid} normalized to {norm_bssid}, SSID: {ssid}, Key: {key}")
+            logger.debug("Formatting network: raw BSSID %s normalized to %s, SSID: %s", bssid, norm_bssid, ssid)
             networks[norm_bssid] = {"ssid": ssid, "key": key}
         except Exception as e:
-            logger.error(f"Error formatting row {row}: {e}")
-    logger.debug(f"Formatted networks dict keys: {list(networks.keys())}")
+            logger.error(f"Error formatting row {row[:2]}: {e}")  # row[2] is the key
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Formatted networks dict keys: %s", list(networks))
     return networks
\ No newline at end of file
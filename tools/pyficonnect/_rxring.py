@@ -0,0 +1,165 @@
+import os
+import mmap
+import ctypes
+import ctypes.util
+import time
+import select
+import socket
+import struct
+from typing import Callable
+
+# locals
+from tools.pyficonnect._fastfilter import attach_bpf_filter, detach_bpf_filter
+
+##############################
+##### PACKET_RX_RING I/O #####
+##############################
+ETH_P_ALL = 0x0003
+SOL_PACKET = 263
+PACKET_RX_RING = 5
+TP_STATUS_KERNEL = 0
+TP_STATUS_USER = 1
+
+# struct tpacket_hdr (TPACKET_V1): status, len, snaplen, mac, net, sec, usec
+TPACKET_HDR = struct.Struct("@LIIHHII")
+TP_STATUS = struct.Struct("@L")
+
+
+class RxRing:
+    """
+    A raw AF_PACKET socket bound to one interface with a memory-mapped PACKET_RX_RING.
+    The kernel writes captured frames straight into the shared ring, so reading a frame
+    costs no syscall and the socket stays open across channel hops.
+    """
+
+    def __init__(self, interface: str, bpf_program: bytes = None,
+                 block_size: int = 1 << 16, block_nr: int = 32, frame_size: int = 2048) -> None:
+        self.interface = interface
+        self.frame_size = frame_size
+        self.frame_nr = (block_size // frame_size) * block_nr
+        self.sock = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(ETH_P_ALL))
+        try:
+            if bpf_program:
+                # attach before bind so unfiltered frames never reach the ring
+                attach_bpf_filter(self.sock, bpf_program)
+            self.sock.setsockopt(SOL_PACKET, PACKET_RX_RING,
+                                 struct.pack("IIII", block_size, block_nr, frame_size, self.frame_nr))
+            self.ring = mmap.mmap(self.sock.fileno(), block_size * block_nr,
+                                  mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+            self.sock.bind((interface, 0))
+        except OSError:
+            self.sock.close()
+            raise
+        self.poller = select.poll()
+        self.poller.register(self.sock.fileno(), select.POLLIN | select.POLLERR)
+        self.index = 0
+
+    def poll(self, timeout: float, handler: Callable[[bytes], None]) -> None:
+        """
+        Hands every frame that arrives within timeout seconds to handler,
+        returning each ring slot to the kernel once handled.
+        """
+        # hot loop: everything it touches per frame is bound to a local first
+        ring = self.ring
+        frame_size = self.frame_size
+        frame_nr = self.frame_nr
+        unpack_status = TP_STATUS.unpack_from
+        unpack_hdr = TPACKET_HDR.unpack_from
+        pack_status = TP_STATUS.pack_into
+        monotonic = time.monotonic
+        wait = self.poller.poll
+        index = self.index
+        deadline = monotonic() + timeout
+        try:
+            while True:
+                offset = index * frame_size
+                if unpack_status(ring, offset)[0] & TP_STATUS_USER:
+                    _, _, snaplen, mac, _, _, _ = unpack_hdr(ring, offset)
+                    start = offset + mac
+                    try:
+                        handler(ring[start:start + snaplen])
+                    finally:
+                        pack_status(ring, offset, TP_STATUS_KERNEL)
+                        index = (index + 1) % frame_nr
+                    continue
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    return
+                wait(remaining * 1000)
+        finally:
+            self.index = index
+
+    def set_filter(self, bpf_program: bytes) -> None:
+        """
+        Swaps the attached BPF program (e.g. after the DB networks were reloaded).
+        """
+        attach_bpf_filter(self.sock, bpf_program)
+
+    def close(self) -> None:
+        try:
+            detach_bpf_filter(self.sock)
+        except OSError:
+            pass  # no filter attached
+        self.ring.close()
+        self.sock.close()
+
+
+############################
+##### BATCHED TX BURST #####
+############################
+class _iovec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _msghdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_iovec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _mmsghdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _msghdr), ("msg_len", ctypes.c_uint)]
+
+
+_libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+_sendmmsg = getattr(_libc, "sendmmsg", None)
+if _sendmmsg is not None:
+    _sendmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_mmsghdr), ctypes.c_uint, ctypes.c_int]
+    _sendmmsg.restype = ctypes.c_int
+
+
+class FrameBurst:
+    """
+    Sends count copies of one frame on a bound packet socket with a single sendmmsg(2).
+    The message vector is built once, so every burst is one syscall and no allocations.
+    """
+
+    def __init__(self, frame: bytes, count: int = 3) -> None:
+        self.frame = frame
+        self.count = count
+        self._buf = ctypes.create_string_buffer(frame, len(frame))
+        self._iov = _iovec(ctypes.cast(self._buf, ctypes.c_void_p), len(frame))
+        self._msgs = (_mmsghdr * count)()
+        for msg in self._msgs:
+            msg.msg_hdr.msg_iov = ctypes.pointer(self._iov)
+            msg.msg_hdr.msg_iovlen = 1
+
+    def send(self, sock: socket.socket) -> int:
+        """
+        Returns the number of frames sent; raises OSError if none could be sent.
+        """
+        if _sendmmsg is None:
+            for _ in range(self.count):
+                sock.send(self.frame)
+            return self.count
+        sent = _sendmmsg(sock.fileno(), self._msgs, self.count, 0)
+        if sent < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        return sent
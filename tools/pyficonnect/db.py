@@ -35,7 +35,8 @@ def safe_sync_pyfyconnect_from_hcxtool(conn: sqlite3.Connection) -> None:
             logger.info("hcxtool table does not exist. Skipping sync.")
             return
 
-        # perform upsert sync based solely on bssid
+        # perform upsert sync based solely on bssid; rows that are already up to date are
+        # left untouched, so a sync with nothing new writes no pages (and keeps the DB mtime)
         upsert_query = """
         INSERT INTO pyficonnect (bssid, ssid, key)
         SELECT bssid, ssid, key FROM hcxtool
@@ -43,7 +44,8 @@ def safe_sync_pyfyconnect_from_hcxtool(conn: sqlite3.Connection) -> None:
           AND bssid <> '' AND key <> ''
         ON CONFLICT(bssid) DO UPDATE SET
             ssid = excluded.ssid,
-            key = excluded.key;
+            key = excluded.key
+        WHERE pyficonnect.ssid IS NOT excluded.ssid OR pyficonnect.key IS NOT excluded.key;
         """
         conn.execute(upsert_query)
         conn.commit()
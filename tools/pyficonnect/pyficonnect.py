@@ -1,3 +1,4 @@
+import os
 import subprocess
 import logging
 from abc import ABC
@@ -13,6 +14,9 @@ from tools.pyficonnect.submenu import PyfyConnectSubmenu
 from tools.tools import Tool
 from utils.tool_registry import register_tool
 
+# nmcli exit status for "connection, device, or access point does not exist"
+NMCLI_NOT_FOUND = 10
+
 
 @register_tool("pyficonnect")
 class PyfiConnectTool(Tool, ABC):
@@ -38,6 +42,9 @@ class PyfiConnectTool(Tool, ABC):
         self.selected_network = None  # SSID of the network
         self.network_password = None  # Password (if needed)
 
+        # shared sink for nmcli output, opened once instead of per subprocess call
+        self._devnull = open(os.devnull, "wb")
+
         # pyficonnect-specific database schema (tools/pyficonnect/db.py)
         conn = get_db_connection(BASE_DIR)
         init_pyfyconnect_schema(conn)
@@ -50,6 +57,11 @@ class PyfiConnectTool(Tool, ABC):
         self.alerted_networks = {}
 
 
+    def __del__(self) -> None:
+        devnull = getattr(self, "_devnull", None)
+        if devnull is not None:
+            devnull.close()
+
     def submenu(self, stdscr) -> None:
         """
         Launches the nmap submenu (interactive UI) using curses.
@@ -62,8 +74,8 @@ class PyfiConnectTool(Tool, ABC):
         Connect to the network using nmcli by creating or updating a connection profile.
         The connection profile is named using the SSID and interface (e.g., 'HomeBase-5G_wlan1').
         This method:
-          1. Checks if a profile with the desired name already exists.
-             - If it exists, it can be updated or removed.
+          1. Deletes any existing profile with the desired name in a single nmcli call
+             (a missing profile is not an error), instead of listing profiles first.
           2. Creates the profile with the SSID, password, and other settings, including:
              - wifi-sec.key-mgmt set to wpa-psk
              - wifi-sec.psk set to the provided password
@@ -78,16 +90,18 @@ class PyfiConnectTool(Tool, ABC):
         # e.g. ssid_wlan1
         con_name = f"{self.selected_network}_{self.selected_interface}"
 
-        # if it exists delete it
-        if self.profile_exists(con_name):
-            try:
-                del_cmd = ["nmcli", "connection", "delete", con_name]
-                self.logger.debug("Profile exists. Deleting existing profile: " + " ".join(del_cmd))
-                subprocess.check_call(del_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        # delete any existing profile; nmcli exits with NMCLI_NOT_FOUND if there is none
+        try:
+            del_cmd = ["nmcli", "connection", "delete", "id", con_name]
+            self.logger.debug("Deleting existing profile if present: " + " ".join(del_cmd))
+            result = subprocess.run(del_cmd, stdout=self._devnull, stderr=self._devnull)
+            if result.returncode == 0:
                 self.logger.info(f"Existing profile '{con_name}' deleted.")
-            except Exception as e:
-                self.logger.error(f"Error deleting existing profile '{con_name}': {e}")
-                return
+            elif result.returncode != NMCLI_NOT_FOUND:
+                raise subprocess.CalledProcessError(result.returncode, del_cmd)
+        except Exception as e:
+            self.logger.error(f"Error deleting existing profile '{con_name}': {e}")
+            return
 
         try:
             # create connection profile
@@ -102,8 +116,11 @@ class PyfiConnectTool(Tool, ABC):
                 "802-11-wireless-security.psk-flags", "0",
                 "autoconnect", "no"
             ]
-            self.logger.debug("Running nmcli add command: " + " ".join(add_cmd))
-            subprocess.check_call(add_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            # the psk is masked so the debug log never holds the key in plaintext
+            psk_index = add_cmd.index("wifi-sec.psk") + 1
+            self.logger.debug("Running nmcli add command: %s",
+                              " ".join(add_cmd[:psk_index] + ["********"] + add_cmd[psk_index + 1:]))
+            subprocess.check_call(add_cmd, stdout=self._devnull, stderr=self._devnull)
             self.logger.info(f"Connection '{con_name}' successfully added.")
         except Exception as e:
             self.logger.error(f"Error adding connection profile: {e}")
@@ -113,28 +130,21 @@ class PyfiConnectTool(Tool, ABC):
             # activate connection
             up_cmd = ["nmcli", "connection", "up", con_name]
             self.logger.debug("Running nmcli connection up command: " + " ".join(up_cmd))
-            subprocess.check_call(up_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            subprocess.check_call(up_cmd, stdout=self._devnull, stderr=self._devnull)
             self.logger.info(
                 f"Connected to {self.selected_network} on {self.selected_interface} using profile '{con_name}'.")
         except Exception as e:
             self.logger.error(f"Error activating connection: {e}")
             return
 
-    def profile_exists(self, con_name: str) -> bool:
+    def cancel(self) -> None:
         """
-        Check if a NetworkManager connection profile with the given name already exists.
+        Aborts a connection attempt that run() is still waiting on (e.g. from the UI thread).
+        Disconnecting the device makes NetworkManager drop the pending activation, so the
+        blocked `nmcli connection up` returns.
         """
-        try:
-            output = subprocess.check_output(
-                ["nmcli", "-g", "NAME", "connection", "show"],
-                text=True
-            )
-            # split where a line is a profile name
-            existing_profiles = [line.strip() for line in output.splitlines() if line.strip()]
-            return con_name in existing_profiles
-        except Exception as e:
-            self.logger.error(f"Error checking if profile exists: {e}")
-            return False
+        self.logger.info(f"Cancelling connection attempt on {self.selected_interface}.")
+        self.disconnect()
 
     def disconnect(self) -> None:
         """
@@ -149,7 +159,7 @@ class PyfiConnectTool(Tool, ABC):
         try:
             disconnect_cmd = ["nmcli", "device", "disconnect", self.selected_interface]
             self.logger.debug("Running nmcli disconnect command: " + " ".join(disconnect_cmd))
-            subprocess.check_call(disconnect_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            subprocess.check_call(disconnect_cmd, stdout=self._devnull, stderr=self._devnull)
             self.logger.info(f"Disconnected {self.selected_interface} using nmcli")
         except Exception as e:
             self.logger.error(f"Error disconnecting using nmcli: {e}")
@@ -1,122 +1,424 @@
+import os
+import queue
+import functools
+import collections
+import socket
 import threading
 import subprocess
 import time
 import logging
-from scapy.layers.dot11 import Dot11
+from typing import List, Union
+from pathlib import Path
 from scapy.all import sniff
 
 # locals
 from common.models import AlertData
 from config.constants import ALL_CHANNELS, BASE_DIR
+from database.db_manager import get_hidden_db_path
+from tools.pyficonnect._fastfilter import (
+    filter_beacon, frame_ssid, bssid_to_bytes, bytes_to_bssid, build_beacon_bpf, build_probe_request
+)
+from tools.pyficonnect._nl80211 import Nl80211
+from tools.pyficonnect._parser import get_pyficonnect_networks_from_db, format_pyficonnect_networks
+from tools.pyficonnect._rxring import FrameBurst, RxRing
 
+ALERT_DELAY = 120  # seconds before the same BSSID may alert again (one wheel bucket per second)
+PROBE_BURST = 3  # probe requests sent per channel visit when active probing
+CHANNEL_REWEIGHT_INTERVAL = 30  # seconds between rebuilding the weighted channel schedule
+MAX_CHANNEL_WEIGHT = 4  # most visits a hot channel gets per sweep
 
-class ScapyManager:
-    _instance = None
 
+class ScapyManager:
     @staticmethod
     def get_instance():
-        if ScapyManager._instance is None:
-            ScapyManager._instance = ScapyManager()
-        return ScapyManager._instance
+        # the process-wide manager is created once at import (see MANAGER below)
+        return MANAGER
 
     def __init__(self):
         self.logger = logging.getLogger("ScapyManager")
         logging.getLogger("scapy.runtime").setLevel(logging.ERROR)
         self.scanner_running = False
         self.selected_interface = None
+        self.scan_interfaces = []       # Monitor interfaces currently used by the scan workers
+        self.rx_rings = {}              # interface -> RxRing opened by its scan worker
+        self._rx_rings_lock = threading.Lock()  # rx_rings + db_bssids filter updates
+        self.nl80211 = None             # Shared nl80211 socket for channel changes (None -> use iw)
+        self._nl80211_lock = threading.Lock()
+        self.ifindexes = {}             # interface -> ifindex, read once per scan from /sys
+        self.interface_macs = {}        # interface -> raw 6-byte MAC, read once per scan from /sys
+        self.active_probing = False     # Send a broadcast probe request after every channel hop
+        self.kernel_bssid_filter = True  # Match DB BSSIDs in the kernel BPF filter, not just frame type
+        self.probe_bursts = {}          # interface -> FrameBurst of its prebuilt probe request
+        self.current_channels = {}      # interface -> channel it is currently tuned to
+        self.channel_hits = collections.Counter()  # channel -> DB matches since the last reweight
+        self._channel_hits_lock = threading.Lock()  # receive threads count, rotation threads drain
+        self.network_channels = {}      # SSID -> channel its DB network was last alerted on
         self.db_networks = {}         # Dictionary of networks loaded from the database
-        self.alerted_networks = {}      # Keeps track of alerts already sent
+        self.db_bssids = set()          # Raw 6-byte BSSIDs of db_networks for the packet filter
+        self._db_mtime_ns = None        # DB file mtime at the last load_db_networks
+        self.alerted_networks = set()   # Raw BSSIDs alerted within the last ALERT_DELAY seconds
+        self._alert_wheel = [set() for _ in range(ALERT_DELAY)]  # alerted_networks by alert second
+        self._wheel_tick = int(time.monotonic())
         self.alert_callbacks = []       # Other tools can register callback functions
+        self._callbacks_snapshot = ()   # Immutable copy of alert_callbacks iterated by publish_alert
+        self._callbacks_lock = threading.Lock()
+        self.alert_queue = queue.SimpleQueue()  # Matches from all scan workers, drained by one publisher
 
     def load_db_networks(self):
         """
-        Loads network data from your database.
-        Replace the placeholder code below with your actual DB loading logic.
+        Loads the pyficonnect networks from the database and rebuilds the BSSID filter.
+        Skipped when the DB file's mtime is unchanged since the last load, so restarting
+        the background scan doesn't re-read an unchanged table.
         """
-        from tools.pyficonnect._parser import get_pyficonnect_networks_from_db, format_pyficonnect_networks
+        try:
+            db_mtime_ns = os.stat(get_hidden_db_path(BASE_DIR)).st_mtime_ns
+        except OSError:
+            db_mtime_ns = None
+        if db_mtime_ns is not None and db_mtime_ns == self._db_mtime_ns:
+            self.logger.debug("DB unchanged since last load; keeping %d networks.", len(self.db_networks))
+            return
         rows = get_pyficonnect_networks_from_db(BASE_DIR)
         self.db_networks = format_pyficonnect_networks(rows)
-        self.logger.debug(f"Loaded DB networks: {list(self.db_networks.keys())}")
+        db_bssids = set()
+        for bssid in self.db_networks:
+            try:
+                db_bssids.add(bssid_to_bytes(bssid))
+            except ValueError:
+                self.logger.warning("Skipping malformed BSSID from DB: %s", bssid)
+        # keep the kernel filters of running scan workers in sync with the DB; under the
+        # lock so a ring registered concurrently (receive_frames) cannot keep the old filter
+        with self._rx_rings_lock:
+            self.db_bssids = db_bssids
+            program = self.kernel_filter_program()
+            for interface, ring in self.rx_rings.items():
+                try:
+                    ring.set_filter(program)
+                except OSError as e:
+                    self.logger.warning("Could not update kernel filter on %s: %s", interface, e)
+        self._db_mtime_ns = db_mtime_ns
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Loaded DB networks: %s", list(self.db_networks))
+
+    def load_db_networks_async(self) -> threading.Thread:
+        """
+        Runs load_db_networks on a daemon thread so a large DB never blocks the caller
+        (the curses UI). Until it finishes, the previous db_bssids stay in effect.
+        """
+        loader = threading.Thread(target=self.load_db_networks, daemon=True)
+        loader.start()
+        return loader
 
     def scapy_packet_handler(self, pkt):
-        from tools.helpers.tool_utils import normalize_mac
-        if pkt.haslayer(Dot11) and pkt.type == 0 and pkt.subtype == 8:
+        """
+        sniff() callback for the fallback path; matches on the packet's raw bytes.
+        """
+        self.handle_frame(pkt.original)
+
+    def handle_frame(self, buf: bytes, interface: str = None):
+        """
+        Matches captured beacons against the DB networks straight from the raw frame bytes
+        (see _fastfilter.filter_beacon) so non-matching frames never touch Scapy's field lookups.
+        interface: Capturing interface; matches are credited to its current channel.
+        """
+        match = filter_beacon(buf, self.db_bssids)
+        if match is None:
+            return
+        dot11, bssid_bytes = match
+        if interface is not None:
+            channel = self.current_channels.get(interface)
+            with self._channel_hits_lock:
+                self.channel_hits[channel] += 1
+        tick = int(time.monotonic())
+        if tick != self._wheel_tick:
+            self._advance_alert_wheel(tick)
+        if bssid_bytes in self.alerted_networks:
+            return
+
+        # only look up/decode the SSID once we know an alert is going out
+        ssid = frame_ssid(buf, dot11).decode('utf-8', errors='ignore') or "<hidden>"
+        bssid = bytes_to_bssid(bssid_bytes)
+        self.logger.info("Detected network - SSID: %s, BSSID: %s", ssid, bssid)
+        channel = self.current_channels.get(interface)
+        if channel is not None:
+            self.network_channels[ssid] = channel
+        alert = AlertData(
+            tool="pyficonnect",
+            data={
+                "action": "NETWORK_FOUND",  # key used for filtering in the UI
+                "ssid": ssid,
+                "bssid": bssid,
+                "msg": f"Detected network {ssid} on {bssid}"
+            }
+        )
+        self.alerted_networks.add(bssid_bytes)
+        self._alert_wheel[tick % ALERT_DELAY].add(bssid_bytes)
+        self.alert_queue.put(alert)
+
+    def _advance_alert_wheel(self, tick: int) -> None:
+        """
+        Moves the alert wheel forward to tick. Every bucket passed over holds the BSSIDs
+        alerted exactly ALERT_DELAY seconds earlier, so those are released from
+        alerted_networks and may alert again.
+        """
+        wheel = self._alert_wheel
+        start = max(self._wheel_tick + 1, tick - ALERT_DELAY + 1)
+        self._wheel_tick = tick
+        for t in range(start, tick + 1):
+            bucket = wheel[t % ALERT_DELAY]
+            if bucket:
+                self.alerted_networks.difference_update(bucket)
+                bucket.clear()
+
+    def _drain_alert_queue(self) -> list:
+        alerts = []
+        while True:
+            try:
+                alerts.append(self.alert_queue.get_nowait())
+            except queue.Empty:
+                return alerts
+
+    def flush_alerts(self) -> None:
+        """
+        Publishes every alert currently queued by the scan workers as a single batch.
+        """
+        alerts = self._drain_alert_queue()
+        if alerts:
+            self.publish_alert(alerts)
+
+    def _alert_publisher(self, dwell_time: float) -> None:
+        """
+        Single consumer of alert_queue so callbacks are never invoked concurrently.
+        Waits for the first alert, lets the rest of the dwell window accumulate, then
+        publishes everything queued as one batch.
+        """
+        while self.scanner_running:
             try:
-                ssid = pkt.info.decode('utf-8', errors='ignore')
-            except Exception:
-                ssid = "<unknown>"
-            if not ssid:
-                ssid = "<hidden>"
-            bssid = normalize_mac(pkt.addr2)
-            if self.db_networks and bssid in self.db_networks:
-                current_time = time.time()
-                alert_delay = 120  # delay in seconds (2 minutes)
-                last_alert_time = self.alerted_networks.get(bssid)
-                if not last_alert_time or (current_time - last_alert_time) > alert_delay:
-                    self.logger.info("Detected network - SSID: %s, BSSID: %s", ssid, bssid)
-                    alert = AlertData(
-                        tool="pyficonnect",
-                        data={
-                            "action": "NETWORK_FOUND",  # key used for filtering in the UI
-                            "ssid": ssid,
-                            "bssid": bssid,
-                            "msg": f"Detected network {ssid} on {bssid}"
-                        }
-                    )
-                    self.alerted_networks[bssid] = current_time
-                    self.publish_alert(alert)
+                first = self.alert_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            time.sleep(dwell_time)
+            self.publish_alert([first] + self._drain_alert_queue())
 
     def publish_alert(self, alert_data):
         """
-        Calls all registered alert callbacks with the given alert data.
+        Calls all registered alert callbacks with the given alert data
+        (a single AlertData or a list of them from one scan pass).
         """
-        for callback in self.alert_callbacks:
+        for callback in self._callbacks_snapshot:
             try:
                 callback(alert_data)
             except Exception as e:
                 self.logger.error("Error in alert callback: %s", e)
 
-    def scan_networks_scapy(self, interface: str, dwell_time: float = 0.2) -> None:
+    def kernel_filter_program(self) -> bytes:
+        """
+        Builds the BPF program attached to the rx rings: beacons/probe responses from the DB
+        BSSIDs when kernel_bssid_filter is on, otherwise beacons/probe responses from anyone.
+        """
+        return build_beacon_bpf(self.db_bssids if self.kernel_bssid_filter else ())
+
+    def open_rx_ring(self, interface: str):
+        """
+        Opens one PACKET_RX_RING capture for interface that is reused across channel hops,
+        with the classic BPF filter from kernel_filter_program attached.
+        Returns None if the ring could not be set up; receive_frames then falls back to sniff().
+        """
+        try:
+            return RxRing(interface, self.kernel_filter_program())
+        except OSError as e:
+            self.logger.warning("Could not open rx ring on %s, falling back to sniff(): %s", interface, e)
+            return None
+
+    def open_nl80211(self) -> None:
+        """
+        Opens the shared nl80211 socket used by set_channel, if the kernel exposes nl80211.
+        """
+        if self.nl80211 is not None:
+            return
+        try:
+            self.nl80211 = Nl80211()
+        except OSError as e:
+            self.logger.warning("nl80211 unavailable, channel changes will use iw: %s", e)
+
+    def read_interface_info(self, interface: str) -> None:
+        """
+        Caches interface's ifindex and MAC address from /sys/class/net so the channel and
+        probe paths never have to query them again.
+        """
+        sys_dir = Path("/sys/class/net") / interface
+        try:
+            self.ifindexes[interface] = int((sys_dir / "ifindex").read_text())
+            self.interface_macs[interface] = bssid_to_bytes((sys_dir / "address").read_text().strip())
+        except (OSError, ValueError) as e:
+            self.logger.error("Could not read interface info of %s: %s", interface, e)
+
+    def set_channel(self, interface: str, channel: int) -> None:
+        """
+        Tunes interface to channel over the persistent nl80211 socket, falling back to
+        forking `iw` if netlink is unavailable or the request fails.
+        Raises subprocess.CalledProcessError if the iw fallback fails.
+        """
+        if self.nl80211 is not None and interface in self.ifindexes:
+            try:
+                with self._nl80211_lock:
+                    self.nl80211.set_channel(self.ifindexes[interface], channel)
+                return
+            except OSError as e:
+                self.logger.debug("nl80211 channel change on %s failed, using iw: %s", interface, e)
+        subprocess.check_call(
+            ["iw", "dev", interface, "set", "channel", str(channel)],
+            stderr=subprocess.DEVNULL
+        )
+
+    def open_probe_socket(self, interface: str):
+        """
+        Opens a raw socket for active probing on interface and builds its probe request
+        burst once (stored in probe_bursts), so each hop only costs one sendmmsg().
+        Returns None if the socket or the interface MAC is unavailable.
+        """
+        src_mac = self.interface_macs.get(interface)
+        if src_mac is None:
+            self.logger.warning("Active probing disabled on %s: MAC address unknown", interface)
+            return None
+        try:
+            sock = socket.socket(socket.AF_PACKET, socket.SOCK_RAW)
+            sock.bind((interface, 0))
+        except OSError as e:
+            self.logger.warning("Active probing disabled on %s: %s", interface, e)
+            return None
+        self.probe_bursts[interface] = FrameBurst(build_probe_request(src_mac), PROBE_BURST)
+        return sock
+
+    def rotate_channels(self, interface: str, dwell_time: float = 0.2, channels: List[int] = None,
+                        probe_sock: socket.socket = None) -> None:
         """
-        Iterates through all channels (2.4 GHz and 5 GHz) and uses Scapy to sniff for beacon frames.
-        dwell_time: The number of seconds to sniff on each channel.
+        Hops interface once through the given channels (all 2.4 GHz and 5 GHz channels by default),
+        staying dwell_time seconds on each. Frames are read concurrently by receive_frames.
+        probe_sock: Optional socket from open_probe_socket; a burst of PROBE_BURST probe requests
+        is sent after each hop, since a single probe's responses often collide.
         """
-        for channel in ALL_CHANNELS:
+        for channel in channels or ALL_CHANNELS:
+            if not self.scanner_running:
+                return
             try:
-                subprocess.check_call(
-                    ["iw", "dev", interface, "set", "channel", str(channel)],
-                    stderr=subprocess.DEVNULL
-                )
+                self.set_channel(interface, channel)
             except subprocess.CalledProcessError as e:
                 self.logger.error("Error switching %s to channel %s: %s", interface, channel, e)
                 continue
+            self.current_channels[interface] = channel
+            if probe_sock is not None:
+                try:
+                    self.probe_bursts[interface].send(probe_sock)
+                except OSError as e:
+                    self.logger.debug("Probe request on %s channel %s failed: %s", interface, channel, e)
+            time.sleep(dwell_time)
+
+    def weighted_channel_schedule(self, channels: List[int]) -> List[int]:
+        """
+        Builds one sweep over channels in which channels with more DB matches since the last
+        call are visited more often (1 + sqrt(hits), capped at MAX_CHANNEL_WEIGHT), with the
+        repeat visits spread across the sweep. Resets the hit counts of these channels.
+        """
+        with self._channel_hits_lock:
+            hits = {channel: self.channel_hits.pop(channel, 0) for channel in channels}
+        weights = {}
+        for channel in channels:
+            weights[channel] = min(MAX_CHANNEL_WEIGHT, 1 + int(hits[channel] ** 0.5))
+        return [channel
+                for visit in range(max(weights.values(), default=1))
+                for channel in channels if weights[channel] > visit]
+
+    def receive_frames(self, interface: str) -> None:
+        """
+        Continuously reads frames from interface until scanning stops, independent of
+        channel hopping. Uses the rx ring, or Scapy's sniff() if the ring cannot be opened.
+        """
+        ring = self.open_rx_ring(interface)
+        if ring is None:
+            while self.scanner_running:
+                try:
+                    sniff(iface=interface, prn=lambda pkt: self.handle_frame(pkt.original, interface),
+                          timeout=1, store=0)
+                except Exception as e:
+                    self.logger.error("Error during sniffing on %s: %s", interface, e)
+                    time.sleep(0.1)
+            return
 
+        with self._rx_rings_lock:
+            self.rx_rings[interface] = ring
+            # the ring was opened with the db_bssids of that moment; a DB load may have
+            # finished since, so attach the current filter now that the loader can see it
             try:
-                sniff(iface=interface, prn=self.scapy_packet_handler, timeout=dwell_time, store=0)
-            except Exception as e:
-                self.logger.error("Error during sniffing on channel %s: %s", channel, e)
-                time.sleep(0.1)
+                ring.set_filter(self.kernel_filter_program())
+            except OSError as e:
+                self.logger.warning("Could not update kernel filter on %s: %s", interface, e)
+        handler = functools.partial(self.handle_frame, interface=interface)
+        try:
+            while self.scanner_running:
+                try:
+                    ring.poll(0.5, handler)
+                except Exception as e:
+                    self.logger.error("Error reading frames on %s: %s", interface, e)
+                    time.sleep(0.1)
+        finally:
+            with self._rx_rings_lock:
+                self.rx_rings.pop(interface, None)
+            ring.close()
 
-    def start_scanning(self, interface: str, dwell_time: float = 0.2):
+    def start_scanning(self, interfaces: Union[str, List[str]], dwell_time: float = 0.2,
+                       active_probing: bool = False, kernel_bssid_filter: bool = True):
         """
-        Starts a background thread that rotates through all channels on the specified interface.
-        It first loads the DB networks so alerts can be generated, then starts scanning.
+        Starts the background scan on one or more monitor-mode interfaces.
+        The DB networks are loaded on a separate thread (alerts start once they are in),
+        and ALL_CHANNELS is split round-robin across the interfaces, so a full sweep takes
+        roughly 1/N of the single-interface time. Each interface gets a channel-rotation thread and a separate
+        receive thread, so frames keep being parsed while the channel is being changed.
+        With active_probing, a broadcast probe request is also sent after every hop.
+        kernel_bssid_filter=False keeps the kernel filter to frame types only (all BSSIDs
+        are then matched in Python), e.g. for drivers that mangle the radiotap header.
+        Every CHANNEL_REWEIGHT_INTERVAL seconds the sweep is rebuilt so channels where DB
+        networks were seen get extra dwell (see weighted_channel_schedule).
         """
-        self.selected_interface = interface
-        self.load_db_networks()
+        if isinstance(interfaces, str):
+            interfaces = [interfaces]
+        self.scan_interfaces = list(interfaces)
+        self.selected_interface = self.scan_interfaces[0]
+        self.kernel_bssid_filter = kernel_bssid_filter
+        self.load_db_networks_async()
+        self.open_nl80211()
+        for interface in self.scan_interfaces:
+            self.read_interface_info(interface)
+        self.active_probing = active_probing
         self.scanner_running = True
 
-        def background_scan():
-            while self.scanner_running:
-                self.scan_networks_scapy(interface, dwell_time=dwell_time)
-                time.sleep(0.2)
+        def background_rotate(interface: str, channels: List[int]):
+            probe_sock = self.open_probe_socket(interface) if self.active_probing else None
+            schedule = channels
+            next_reweight = time.monotonic() + CHANNEL_REWEIGHT_INTERVAL
+            try:
+                while self.scanner_running:
+                    self.rotate_channels(interface, dwell_time=dwell_time, channels=schedule,
+                                         probe_sock=probe_sock)
+                    if time.monotonic() >= next_reweight:
+                        schedule = self.weighted_channel_schedule(channels)
+                        next_reweight = time.monotonic() + CHANNEL_REWEIGHT_INTERVAL
+            finally:
+                if probe_sock is not None:
+                    probe_sock.close()
 
-        threading.Thread(target=background_scan, daemon=True).start()
-        self.logger.info("Global Scapy-based background scanning started on %s", interface)
+        threading.Thread(target=self._alert_publisher, args=(dwell_time,), daemon=True).start()
+        count = len(self.scan_interfaces)
+        for idx, interface in enumerate(self.scan_interfaces):
+            channels = ALL_CHANNELS[idx::count]
+            threading.Thread(target=self.receive_frames, args=(interface,), daemon=True).start()
+            threading.Thread(target=background_rotate, args=(interface, channels), daemon=True).start()
+            self.logger.info("Global Scapy-based background scanning started on %s (channels %s)",
+                             interface, channels)
 
     def stop_scanning(self):
         """
-        Stops the background scanning process.
+        Stops the background scanning process. Each receive thread detaches its kernel filter
+        and closes its rx ring once its current poll returns.
         """
         self.scanner_running = False
         self.logger.info("Global Scapy-based background scanning stopped.")
@@ -125,14 +427,22 @@ class ScapyManager:
         """
         Registers a callback function that will be called when a network alert is generated.
         """
-        if callback not in self.alert_callbacks:
-            self.alert_callbacks.append(callback)
-            self.logger.info("Alert callback registered.")
+        with self._callbacks_lock:
+            if callback not in self.alert_callbacks:
+                self.alert_callbacks.append(callback)
+                self._callbacks_snapshot = tuple(self.alert_callbacks)
+                self.logger.info("Alert callback registered.")
 
     def unregister_alert_callback(self, callback):
         """
         Unregisters a previously registered alert callback.
         """
-        if callback in self.alert_callbacks:
-            self.alert_callbacks.remove(callback)
-            self.logger.info("Alert callback unregistered.")
+        with self._callbacks_lock:
+            if callback in self.alert_callbacks:
+                self.alert_callbacks.remove(callback)
+                self._callbacks_snapshot = tuple(self.alert_callbacks)
+                self.logger.info("Alert callback unregistered.")
+
+
+# single process-wide instance; import this directly or use ScapyManager.get_instance()
+MANAGER = ScapyManager()
@@ -1,47 +1,199 @@
+import os
 import curses
 import logging
+import threading
 import time
-from typing import List, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Tuple, Any, Optional
 
 # local
+from config.constants import BASE_DIR
+from database.db_manager import get_hidden_db_path
 from tools.submenu import BaseSubmenu
+from tools.helpers.sql_utils import get_founds_for_ssids
+from tools.helpers.tool_utils import (
+    get_wifi_networks, get_wifi_networks_multi, rescan_wifi_networks, get_all_connected_interfaces,
+    get_interface_mode, scan_wifi_frequencies, switch_interface_to_managed, switch_interface_to_monitor
+)
+from tools.pyficonnect._nl80211 import channel_to_freq
 from tools.pyficonnect.scapymanager import ScapyManager
 
+SCAN_CACHE_TTL = 30  # seconds a per-interface nmcli scan result is reused
+MODE_CACHE_TTL = 5  # seconds an interface mode read with iw is trusted
+RESCAN_OPTION = "Rescan"
+START_SCAN_OPTION = "Start Scan"
+SPINNER = "|/-\\"
+
+# interface, sorted tuple of interfaces, or (interface, (MHz, ...)) for channel-limited iw scans
+# -> (monotonic timestamp, [(SSID, SECURITY), ...]);
+# module level so it outlives the submenu instance, which the tool recreates every time
+# the submenu is opened
+_SCAN_CACHE = {}
+_SCAN_CACHE_LOCK = threading.Lock()
+_MODE_CACHE = {}  # interface -> (monotonic timestamp, mode), see interface_mode
+
+
+@lru_cache(maxsize=4)
+def _founds_for_ssids(db_mtime_ns: int, ssids: frozenset) -> dict:
+    # db_mtime_ns is only part of the cache key: any write to the DB changes it
+    return dict(get_founds_for_ssids(BASE_DIR, ssids))
+
 
 class PyfyConnectSubmenu(BaseSubmenu):
+    SEC_SECURED = " (Secured)"
+    SEC_OPEN = " (Open)"
+    ALERT_POLL_MS = 1000  # alerts are refreshed by the menus' key waits, not a thread
+    BASE_MENU_ITEMS = ["Scan", "Manage", "Utils"]
+
     def __init__(self, tool_instance, stdscr=None):
         super().__init__(tool_instance, stdscr)
         self.logger = logging.getLogger("PyfyConnectSubmenu")
         self.logger.debug("PyfyConnectSubmenu initialized.")
-        #self.scapy_manager = ScapyManager.get_instance()
-        #self.scapy_manager.register_alert_callback(self.handle_alert)
+        self._executor = None  # ThreadPoolExecutor running nmcli scans/connects off the curses thread
 
     ###########################
     ##### TOOL SCAN LOGIC #####
     ###########################
-    def scan_networks(self) -> List[Tuple[str, str]]:
+    def scan_networks(self, rescan: bool = False, interfaces: Optional[List[str]] = None) -> List[Tuple[str, str]]:
         """
-        Scans for available networks using nmcli on the currently selected interface.
+        Scans for available networks using nmcli on the currently selected interface, or on
+        all of interfaces at once (see get_wifi_networks_multi) when more than one is given.
+        Results are cached per interface (set) for SCAN_CACHE_TTL seconds; rescan=True drops
+        the cached entry and forces a new scan (see rescan_wifi_networks).
         Returns a list of tuples in the form (SSID, SECURITY).
         """
-        from tools.helpers.tool_utils import get_wifi_networks
-        if not self.tool.selected_interface:
+        if not interfaces:
+            interfaces = [self.tool.selected_interface] if self.tool.selected_interface else []
+        if not interfaces:
             self.logger.error("No interface selected for scanning networks.")
             return []
-        return get_wifi_networks(self.tool.selected_interface, self.logger)
+        key = interfaces[0] if len(interfaces) == 1 else tuple(sorted(interfaces))
+
+        with _SCAN_CACHE_LOCK:
+            cached = _SCAN_CACHE.get(key)
+        if not rescan and cached and time.monotonic() - cached[0] < SCAN_CACHE_TTL:
+            return cached[1]
+
+        mode = "yes" if rescan else "auto"
+        if len(interfaces) == 1 and rescan:
+            networks = rescan_wifi_networks(interfaces[0], self.logger)
+        elif len(interfaces) == 1:
+            networks = get_wifi_networks(interfaces[0], self.logger, rescan=mode)
+        else:
+            networks = get_wifi_networks_multi(interfaces, self.logger, rescan=mode)
+        with _SCAN_CACHE_LOCK:
+            if networks:
+                _SCAN_CACHE[key] = (time.monotonic(), networks)
+            else:
+                _SCAN_CACHE.pop(key, None)
+        return networks
+
+    def invalidate_scan_cache(self, interface: str) -> None:
+        """
+        Drops cached scan results that include interface, e.g. after it was disconnected or
+        taken out of managed mode, so the next scan_networks call runs nmcli again.
+        """
+        with _SCAN_CACHE_LOCK:
+            for key in [k for k in _SCAN_CACHE if k == interface or (isinstance(k, tuple) and interface in k)]:
+                del _SCAN_CACHE[key]
+
+    def scan_networks_async(self, parent_win, message: str, rescan: bool = False) -> Optional[List[Tuple[str, str]]]:
+        """
+        Runs scan_networks on the executor and animates a spinner in parent_win until it
+        finishes, so the UI keeps responding during a long nmcli scan.
+        Returns the scan result, or None if the user pressed ESC to abort.
+        """
+        # nmcli keeps running in the worker after ESC; its result is just discarded
+        future = self.run_with_spinner(parent_win, message, "Press ESC to cancel.", (27,),
+                                       self.scan_networks, rescan)
+        return None if future is None else future.result()
+
+    def run_with_spinner(self, parent_win, message: str, hint: str, cancel_keys: Tuple[int, ...], fn, *args):
+        """
+        Submits fn(*args) to the executor and animates a spinner after message in
+        parent_win until it is done, polling for input every 100ms.
+        Returns the finished Future, or None if one of cancel_keys was pressed first.
+        """
+        if self._executor is None:
+            # two workers: a connection attempt must not queue behind an abandoned scan
+            self._executor = ThreadPoolExecutor(max_workers=2)
+        future = self._executor.submit(fn, *args)
+        parent_win.nodelay(True)
+        try:
+            i = 0
+            while not future.done():
+                self.show_status(parent_win, f"{message} {SPINNER[i % len(SPINNER)]}", hint)
+                if parent_win.getch() in cancel_keys:
+                    future.cancel()
+                    return None
+                curses.napms(100)
+                i += 1
+                if i % 10 == 0:
+                    self.update_alert_window()
+        finally:
+            parent_win.nodelay(False)
+        return future
+
+    def get_founds(self, ssids) -> dict:
+        """
+        Returns the founds from the database for the given SSIDs as {SSID: key}. Only those
+        SSIDs are queried (see get_founds_for_ssids), and the result is memoized on the DB
+        file's mtime, so connect retries don't reopen SQLite until the DB actually changes.
+        """
+        ssids = frozenset(ssids)
+        try:
+            db_mtime_ns = os.stat(get_hidden_db_path(BASE_DIR)).st_mtime_ns
+        except OSError:
+            return dict(get_founds_for_ssids(BASE_DIR, ssids))
+        return _founds_for_ssids(db_mtime_ns, ssids)
+
+    def scan_founds_channels(self, parent_win, iface: str) -> Optional[List[Tuple[str, str]]]:
+        """
+        Fast path for connect-from-founds: if the background scan has heard any of the
+        founds, runs a single iw scan limited to the channels they were last seen on, on
+        the executor with a spinner. The result is cached in _SCAN_CACHE like nmcli scans.
+        Returns the scan results only if at least one found network is among them,
+        otherwise an empty list (the caller then does a full nmcli scan), or None if the
+        user pressed ESC to abort.
+        """
+        known_channels = dict(ScapyManager.get_instance().network_channels)
+        if not known_channels:
+            return []
+        founds = self.get_founds(known_channels)
+        freqs = tuple(sorted({channel_to_freq(known_channels[ssid]) for ssid in founds}))
+        if not freqs:
+            return []
+        key = (iface, freqs)
+        with _SCAN_CACHE_LOCK:
+            cached = _SCAN_CACHE.get(key)
+        if cached and time.monotonic() - cached[0] < SCAN_CACHE_TTL:
+            networks = cached[1]
+        else:
+            future = self.run_with_spinner(parent_win, f"Scanning last known channels on {iface}...",
+                                           "Press ESC to cancel.", (27,),
+                                           scan_wifi_frequencies, iface, list(freqs), self.logger)
+            if future is None:
+                return None
+            networks = future.result()
+            with _SCAN_CACHE_LOCK:
+                if networks:
+                    _SCAN_CACHE[key] = (time.monotonic(), networks)
+                else:
+                    _SCAN_CACHE.pop(key, None)
+        if any(ssid in founds for ssid, _ in networks):
+            return networks
+        return []
 
     def select_connected_interface(self, parent_win) -> any:
         """
         Presents a paginated menu of currently connected interfaces.
         """
-        from tools.helpers.tool_utils import get_all_connected_interfaces
         while True:
             connected = get_all_connected_interfaces(self.logger)
             if not connected:
-                parent_win.clear()
-                parent_win.addstr(0, 0, "No connected interfaces found!")
-                parent_win.refresh()
-                parent_win.getch()
+                self.show_status(parent_win, "No connected interfaces found!")
+                self.read_key(parent_win)
                 return None
             selection = self.draw_paginated_menu(parent_win, "Select Connected Interface", connected)
             if selection == "back":
@@ -52,31 +204,41 @@ class PyfyConnectSubmenu(BaseSubmenu):
     def select_network(self, parent_win) -> Tuple[Any, Any]:
         """
         Uses scan_networks to get available networks, then presents them for selection.
+        Selecting "Rescan" forces a fresh scan and redraws the list.
         Returns a tuple (SSID, SECURITY) or (None, None) if cancelled.
         """
-        networks = self.scan_networks()
-        if not networks:
-            parent_win.clear()
-            parent_win.addstr(0, 0, "No WiFi networks found!")
-            parent_win.refresh()
-            parent_win.getch()
-            return None, None
-        menu_items = []
-        for ssid, security in networks:
-            sec_str = " (Secured)" if security and security != "--" else " (Open)"
-            menu_items.append(f"{ssid}{sec_str}")
-        selection = self.draw_paginated_menu(parent_win, "Available Networks", menu_items)
-        if selection == "back":
-            return None, None
-        chosen_ssid = None
-        chosen_security = None
-        for ssid, security in networks:
-            sec_str = " (Secured)" if security and security != "--" else " (Open)"
-            if f"{ssid}{sec_str}" == selection:
-                chosen_ssid = ssid
-                chosen_security = security
+        rescan = False
+        while True:
+            networks = self.scan_networks_async(parent_win, "Scanning for networks...", rescan=rescan)
+            if networks is None:
+                return None, None
+            if not networks:
+                self.show_status(parent_win, "No WiFi networks found!")
+                self.read_key(parent_win)
+                return None, None
+            menu_items = []
+            label_to_entry = {}
+            for ssid, security in networks:
+                label = self.network_label(ssid, security)
+                menu_items.append(label)
+                label_to_entry.setdefault(label, (ssid, security))
+            menu_items.append(RESCAN_OPTION)
+            selection = self.draw_paginated_menu(parent_win, "Available Networks", menu_items)
+            if selection == "back":
+                return None, None
+            if selection != RESCAN_OPTION:
                 break
-        return chosen_ssid, chosen_security
+            rescan = True
+        return label_to_entry.get(selection, (None, None))
+
+    @staticmethod
+    def network_label(ssid: str, security: str) -> str:
+        """
+        Menu label for a scanned network, e.g. 'HomeBase (Secured)'.
+        """
+        if security and security != "--":
+            return ssid + PyfyConnectSubmenu.SEC_SECURED
+        return ssid + PyfyConnectSubmenu.SEC_OPEN
 
     def prompt_for_password(self, parent_win, security: str) -> str:
         """
@@ -84,9 +246,7 @@ class PyfyConnectSubmenu(BaseSubmenu):
         """
         if not security or security == "--":
             return ""
-        parent_win.clear()
-        parent_win.addstr(0, 0, "Enter password for secured network:")
-        parent_win.refresh()
+        self.show_status(parent_win, "Enter password for secured network:")
         curses.echo()
         try:
             pwd = parent_win.getstr(1, 0).decode("utf-8").strip()
@@ -105,27 +265,25 @@ class PyfyConnectSubmenu(BaseSubmenu):
           5. Prompt for password if needed.
           6. Attempt the connection via self.tool.run() using attempt_connection().
 
-        Uses a nested loop so that if an error occurs, the user can retry or cancel.
+        If an attempt fails and the user retries, the flow resumes at step 4 on the same
+        interface (the scan is then served from the scan cache) instead of starting over.
         """
-        while True:
-            # ensure no previous selections
-            self.tool.selected_interface = None
-            self.tool.selected_network = None
-            self.tool.network_password = None
-
-            # select interface to use for the new connection
-            selected_iface = self.select_interface(parent_win)
-            if not selected_iface:
-                self.logger.debug("No interface selected; aborting connection.")
-                return
-            self.tool.selected_interface = selected_iface
+        # ensure no previous selections
+        self.tool.selected_interface = None
+        self.tool.selected_network = None
+        self.tool.network_password = None
 
-            # helper from tools/helpers/tool_utils.py to ensure managed
-            parent_win.clear()
-            parent_win.refresh()
-            if not self.ensure_interface_managed(parent_win, selected_iface):
-                return
+        # select interface to use for the new connection
+        selected_iface = self.select_interface(parent_win)
+        if not selected_iface:
+            self.logger.debug("No interface selected; aborting connection.")
+            return
+        self.tool.selected_interface = selected_iface
 
+        if not self.ensure_interface_managed(parent_win, selected_iface):
+            return
+
+        while True:
             # select network
             chosen_ssid, chosen_security = self.select_network(parent_win)
             if not chosen_ssid:
@@ -153,86 +311,83 @@ class PyfyConnectSubmenu(BaseSubmenu):
         Connect from Founds:
           1. Reset values and select interface.
           2. Ensure the interface is in managed mode.
-          3. Scan for networks.
-          4. Retrieve found networks (SSID, key) from the database.
-          5. Filter scan results to those found in the DB.
+          3. Scan for networks (only the founds' last known channels if the background
+             scan has seen them, otherwise a full nmcli scan).
+          4. Retrieve found networks (SSID, key) from the database for the scanned SSIDs.
+          5. Filter scan results to those found in the DB; a single match is confirmed
+             (connect, rescan or cancel) instead of being picked from a menu.
           6. Auto-fill SSID and password based on found records.
           7. Attempt connection using self.tool.run() via a helper.
 
-        Uses a nested loop to allow retry on failure.
+        If an attempt fails and the user retries, the flow resumes at step 3 on the same
+        interface (scan and founds then come from their caches) instead of starting over.
         """
-        from tools.helpers.tool_utils import get_wifi_networks
+        self.reset_connection_values()
 
-        while True:
-            self.reset_connection_values()
+        selected_iface = self.select_interface(parent_win)
+        if not selected_iface:
+            self.logger.debug("No interface selected; aborting connect-from-founds.")
+            return
+        self.tool.selected_interface = selected_iface
 
-            selected_iface = self.select_interface(parent_win)
-            if not selected_iface:
-                self.logger.debug("No interface selected; aborting connect-from-founds.")
-                return
-            self.tool.selected_interface = selected_iface
+        if not self.ensure_interface_managed(parent_win, selected_iface):
+            return
 
-            # ensure the interface is in managed mode
-            parent_win.clear()
-            parent_win.refresh()
-            if not self.ensure_interface_managed(parent_win, selected_iface):
+        rescan = False
+        while True:
+            scan_networks = [] if rescan else self.scan_founds_channels(parent_win, selected_iface)
+            if scan_networks == []:
+                scan_networks = self.scan_networks_async(parent_win, f"Scanning for networks on {selected_iface}...",
+                                                         rescan=rescan)
+            rescan = False
+            if scan_networks is None:
                 return
-
-            parent_win.clear()
-            parent_win.addstr(0, 0, f"Scanning for networks on {selected_iface}...")
-            parent_win.refresh()
-
-            scan_networks = get_wifi_networks(selected_iface, self.logger)
-            self.logger.debug(f"Networks found from scan: {scan_networks}")
+            self.logger.debug("Networks found from scan: %s", scan_networks)
             if not scan_networks:
-                parent_win.clear()
-                parent_win.addstr(0, 0, "No networks found from scan!")
-                parent_win.refresh()
-                parent_win.getch()
+                self.show_status(parent_win, "No networks found from scan!")
+                self.read_key(parent_win)
                 return
 
-            parent_win.clear()
-            parent_win.addstr(0, 0, "Loading found networks from database...")
-            parent_win.refresh()
-
-            from config.constants import BASE_DIR
-            from tools.helpers.sql_utils import get_founds_ssid_and_key
-            founds = get_founds_ssid_and_key(BASE_DIR)
-            self.logger.debug(f"Raw founds (SSID, key): {founds}")
-            if not founds:
-                parent_win.clear()
-                parent_win.addstr(0, 0, "No found networks in the database!")
-                parent_win.refresh()
-                parent_win.getch()
-                return
-            founds_dict = dict(founds)
-            self.logger.debug(f"Found networks in DB: {founds_dict}")
-
-            filtered_networks = [(ssid, sec) for ssid, sec in scan_networks if ssid in founds_dict]
-            self.logger.debug(f"Filtered networks matching founds: {filtered_networks}")
-            if not filtered_networks:
-                parent_win.clear()
-                parent_win.addstr(0, 0, "No found networks are currently available!")
-                parent_win.refresh()
-                parent_win.getch()
-                return
+            self.show_status(parent_win, "Loading found networks from database...")
+
+            founds_dict = self.get_founds(ssid for ssid, _ in scan_networks)
+            self.logger.debug("Found networks in DB among scanned: %s", list(founds_dict))
 
+            # filter to founds and build the menu in a single pass over the scan
             menu_items = []
-            for ssid, security in filtered_networks:
-                sec_str = " (Secured)" if security and security != "--" else " (Open)"
-                menu_items.append(f"{ssid}{sec_str}")
-            selection = self.draw_paginated_menu(parent_win, "Available Found Networks", menu_items)
-            if selection == "back":
+            label_to_entry = {}
+            for ssid, security in scan_networks:
+                if ssid not in founds_dict:
+                    continue
+                label = self.network_label(ssid, security)
+                menu_items.append(label)
+                label_to_entry.setdefault(label, (ssid, security))
+            self.logger.debug("Scanned networks matching founds: %s", menu_items)
+            if not menu_items:
+                self.show_status(parent_win, "No found networks are currently available!")
+                self.read_key(parent_win)
                 return
 
-            chosen_ssid = None
-            chosen_security = None
-            for ssid, security in filtered_networks:
-                sec_str = " (Secured)" if security and security != "--" else " (Open)"
-                if f"{ssid}{sec_str}" == selection:
-                    chosen_ssid = ssid
-                    chosen_security = security
-                    break
+            if len(menu_items) == 1:
+                # a single match skips the menu, but is still confirmed before connecting
+                selection = menu_items[0]
+                self.show_status(parent_win,
+                                 f"Connect to '{selection}' on {selected_iface}?",
+                                 "Press 1 to connect, 2 to rescan, or 0 to cancel.")
+                key = self.read_key(parent_win)
+                if key == ord("2"):
+                    # drops the cached channel scan too, not just the nmcli listing
+                    self.invalidate_scan_cache(selected_iface)
+                    rescan = True
+                    continue
+                if key != ord("1"):
+                    return
+            else:
+                selection = self.draw_paginated_menu(parent_win, "Available Found Networks", menu_items)
+                if selection == "back":
+                    return
+
+            chosen_ssid, chosen_security = label_to_entry.get(selection, (None, None))
             if not chosen_ssid:
                 self.logger.debug("No network selected; aborting connect-from-founds.")
                 return
@@ -240,7 +395,7 @@ class PyfyConnectSubmenu(BaseSubmenu):
             self.tool.selected_network = chosen_ssid
             auto_password = founds_dict.get(chosen_ssid, "")
             self.tool.network_password = auto_password
-            self.logger.debug(f"Auto-filled password for '{chosen_ssid}': {auto_password}")
+            self.logger.debug("Auto-filled password for '%s' from founds.", chosen_ssid)
 
             # Use the helper to attempt the connection.
             result = self.attempt_connection(parent_win, selected_iface, chosen_ssid)
@@ -260,68 +415,93 @@ class PyfyConnectSubmenu(BaseSubmenu):
             return
         self.tool.selected_interface = selected_iface
 
-        parent_win.clear()
-        parent_win.addstr(0, 0, f"Disconnecting {selected_iface}...")
-        parent_win.refresh()
+        self.show_status(parent_win, f"Disconnecting {selected_iface}...")
         try:
             self.tool.disconnect()
-            parent_win.addstr(1, 0, "Disconnected successfully.")
+            self.invalidate_scan_cache(selected_iface)
+            result_msg = "Disconnected successfully."
         except Exception as e:
-            parent_win.addstr(1, 0, f"Error disconnecting: {e}")
-        parent_win.refresh()
-        parent_win.getch()
+            result_msg = f"Error disconnecting: {e}"
+        self.show_status(parent_win, f"Disconnecting {selected_iface}...", result_msg)
+        self.read_key(parent_win)
+
+    def select_scan_interfaces(self, parent_win) -> List[str]:
+        """
+        Lets the user pick one or more interfaces for the background scan: the first pick
+        is made like select_interface, then further interfaces can be added (the channel
+        sweep is split across them) until "Start Scan" is chosen or none are left.
+        Returns the chosen interfaces, or an empty list if cancelled.
+        """
+        first = self.select_interface(parent_win)
+        if not first:
+            return []
+        chosen = [first]
+        while True:
+            remaining = [iface for iface in self.available_interfaces() if iface not in chosen]
+            if not remaining:
+                return chosen
+            selection = self.draw_paginated_menu(
+                parent_win, f"Add Scan Interface ({', '.join(chosen)})", [START_SCAN_OPTION] + remaining)
+            if selection == self.BACK_OPTION:
+                return []
+            if selection == START_SCAN_OPTION:
+                return chosen
+            chosen.append(selection)
 
     def launch_background_scan(self, parent_win) -> None:
         """
         Initiates the background scan process for matching networks from the database
-        using the global ScapyManager. Forces the user to select an interface, then starts
-        the global scanning thread if not already running, and returns immediately to the main menu.
+        using the global ScapyManager. Forces the user to select one or more interfaces
+        (see select_scan_interfaces), switches them to monitor mode, then starts the global
+        scanning threads if not already running, and returns immediately to the main menu.
         """
-        parent_win.erase()
-        parent_win.refresh()
+        self.show_status(parent_win)
         self.reset_connection_values()
 
-        # Prompt for interface
-        selected_iface = self.select_interface(parent_win)
-        parent_win.erase()
-        parent_win.refresh()
-        if not selected_iface:
+        # Prompt for interfaces
+        selected_ifaces = self.select_scan_interfaces(parent_win)
+        self.show_status(parent_win)
+        if not selected_ifaces:
             self.logger.debug("No interface selected; aborting background scan.")
             return
 
         # set iface & check for monitor & switch if not
-        self.tool.selected_interface = selected_iface
-        from tools.helpers.tool_utils import get_interface_mode, switch_interface_to_monitor
-        current_mode = get_interface_mode(selected_iface, self.logger)
-        if current_mode.lower() != "monitor":
+        self.tool.selected_interface = selected_ifaces[0]
+        for selected_iface in selected_ifaces:
+            current_mode = self.interface_mode(selected_iface)
+            if current_mode.lower() == "monitor":
+                continue
             self.logger.info("Interface %s is in %s mode; switching to monitor mode.", selected_iface, current_mode)
             if not switch_interface_to_monitor(selected_iface, self.logger):
+                _MODE_CACHE.pop(selected_iface, None)
                 self.logger.error("Failed to switch interface %s to monitor mode.", selected_iface)
             else:
+                _MODE_CACHE[selected_iface] = (time.monotonic(), "monitor")
+                self.invalidate_scan_cache(selected_iface)
                 self.logger.info("Interface %s successfully switched to monitor mode.", selected_iface)
 
         # global ScapyManager instance
-        from tools.pyficonnect.scapymanager import ScapyManager
         scapymanager = ScapyManager.get_instance()
-        scapymanager.load_db_networks()
 
-        # start
+        # start (start_scanning loads the DB networks itself, off this thread)
         if not scapymanager.scanner_running:
             try:
-                scapymanager.start_scanning(selected_iface, dwell_time=0.2)
+                scapymanager.start_scanning(
+                    selected_ifaces,
+                    dwell_time=0.2,
+                    active_probing=self.tool.defaults.get("active_probing", False),
+                    kernel_bssid_filter=self.tool.defaults.get("kernel_bssid_filter", True)
+                )
             except Exception as e:
-                parent_win.erase()
-                parent_win.addstr(0, 0, f"Error starting background scan: {e}")
-                parent_win.refresh()
-                curses.napms(2000)
+                self.show_status(parent_win, f"Error starting background scan: {e}")
+                self.wait_for_key(parent_win, 2)
                 return
         else:
+            scapymanager.load_db_networks_async()
             self.logger.info("Global background scanning is already running.")
 
-        parent_win.erase()
-        parent_win.addstr(0, 0, "Background scan started. Alerts will appear as networks are found.")
-        parent_win.refresh()
-        curses.napms(1500)
+        self.show_status(parent_win, "Background scan started. Alerts will appear as networks are found.")
+        self.wait_for_key(parent_win, 1.5)
         return
 
     ###########################
@@ -334,8 +514,7 @@ class PyfyConnectSubmenu(BaseSubmenu):
         """
         conn_options = ["Manual Connect", "Auto-Connect", "Disconnect"]
         while True:
-            parent_win.clear()
-            parent_win.refresh()
+            # draw_menu erases parent_win itself, so no separate blank frame is pushed first
             selection = self.draw_paginated_menu(parent_win, "Connection Management", conn_options)
             if selection.lower() == self.BACK_OPTION:
                 break
@@ -345,13 +524,61 @@ class PyfyConnectSubmenu(BaseSubmenu):
                 self.launch_connect_from_founds(parent_win)
             elif selection == "Disconnect":
                 self.launch_disconnect(parent_win)
-            # clear and redisplay
-            parent_win.clear()
-            parent_win.refresh()
 
     ##########################
     ##### HELPER METHODS #####
     ##########################
+    def show_status(self, parent_win, *lines: str) -> None:
+        """
+        Replaces the contents of parent_win with the given lines (one per row) and pushes
+        them to the terminal in a single update: erase() avoids clear()'s forced full repaint
+        and noutrefresh()/doupdate() batches the write.
+        """
+        parent_win.erase()
+        for row, line in enumerate(lines):
+            parent_win.addstr(row, 0, line)
+        parent_win.noutrefresh()
+        curses.doupdate()
+
+    def read_key(self, parent_win) -> int:
+        """
+        Discards keys typed ahead (e.g. while a scan or pause was running) and waits for a
+        fresh keypress, so a stale "0" cannot cancel a retry prompt by itself.
+        """
+        curses.flushinp()
+        return self.getch_with_alerts(parent_win)
+
+    def wait_for_key(self, parent_win, seconds: float) -> int:
+        """
+        Waits up to seconds for a keypress, polling every 100ms so the wait can be cut short
+        (used instead of curses.napms, which ignores input for its whole duration).
+        Returns the key pressed, or -1 if the time ran out.
+        """
+        parent_win.timeout(100)
+        try:
+            deadline = time.monotonic() + seconds
+            while time.monotonic() < deadline:
+                key = parent_win.getch()
+                if key != -1:
+                    return key
+            return -1
+        finally:
+            parent_win.timeout(-1)
+
+    def interface_mode(self, interface: str) -> str:
+        """
+        Returns get_interface_mode(interface), reusing a result up to MODE_CACHE_TTL seconds
+        old so moving between submenus doesn't fork iw every time. Mode switches made from
+        this submenu update the cache directly.
+        """
+        cached = _MODE_CACHE.get(interface)
+        if cached and time.monotonic() - cached[0] < MODE_CACHE_TTL:
+            return cached[1]
+        mode = get_interface_mode(interface, self.logger)
+        if mode:
+            _MODE_CACHE[interface] = (time.monotonic(), mode)
+        return mode
+
     def ensure_interface_managed(self, parent_win, interface) -> bool:
         """
         Checks if the specified interface is in 'managed' mode.
@@ -359,68 +586,77 @@ class PyfyConnectSubmenu(BaseSubmenu):
         Returns True if the interface is (or was successfully switched to) managed;
         otherwise, returns False.
         """
-        from tools.helpers.tool_utils import get_interface_mode, switch_interface_to_managed
-
-        current_mode = get_interface_mode(interface, self.logger)
+        self.show_status(parent_win)
+        current_mode = self.interface_mode(interface)
         if current_mode == "managed":
             return True
 
-        parent_win.clear()
-        parent_win.addstr(0, 0, f"Interface {interface} is in '{current_mode}' mode.")
-        parent_win.addstr(1, 0, "Press 1 to switch to managed mode, or 2 to cancel.")
-        parent_win.refresh()
-        key = parent_win.getch()
+        self.show_status(parent_win,
+                         f"Interface {interface} is in '{current_mode}' mode.",
+                         "Press 1 to switch to managed mode, or 2 to cancel.")
+        if self.read_key(parent_win) != ord("1"):
+            return False
         try:
-            if chr(key) == "1":
-                if switch_interface_to_managed(interface, self.logger):
-                    parent_win.clear()
-                    parent_win.addstr(0, 0, f"Switched {interface} to managed mode. Press any key to continue.")
-                    parent_win.refresh()
-                    parent_win.getch()
-                    return True
-                else:
-                    parent_win.clear()
-                    parent_win.addstr(0, 0, f"Failed to switch {interface} to managed mode. Press any key to cancel.")
-                    parent_win.refresh()
-                    parent_win.getch()
-                    return False
+            if switch_interface_to_managed(interface, self.logger):
+                _MODE_CACHE[interface] = (time.monotonic(), "managed")
+                self.show_status(parent_win, f"Switched {interface} to managed mode. Press any key to continue.")
+                self.read_key(parent_win)
+                return True
             else:
+                _MODE_CACHE.pop(interface, None)
+                self.show_status(parent_win, f"Failed to switch {interface} to managed mode. Press any key to cancel.")
+                self.read_key(parent_win)
                 return False
         except Exception:
             return False
 
     def attempt_connection(self, parent_win, iface, ssid):
         """
-        Attempts to launch the connection by calling self.tool.run().
-        Displays a confirmation message before the attempt. If an error occurs,
-        prompts the user to retry (any key) or cancel (press "0").
+        Attempts to launch the connection by calling self.tool.run() on the executor right
+        away; the "Connecting to ..." message stays up with a spinner while nmcli activates
+        the profile, and pressing "0" or ESC aborts it via self.tool.cancel().
+        If an error occurs, prompts the user to retry (any key) or cancel (press "0").
 
         Returns:
           True  - if the connection was successful.
           False - if the attempt failed and the user wants to retry.
           None  - if the user cancels.
         """
-        parent_win.clear()
-        confirm_msg = f"Connecting to '{ssid}' on {iface}..."
-        parent_win.addstr(0, 0, confirm_msg)
-        parent_win.refresh()
-        curses.napms(1500)
+        curses.flushinp()  # a key typed ahead must not cancel the attempt before it starts
+        future = self.run_with_spinner(parent_win, f"Connecting to '{ssid}' on {iface}...",
+                                       "Press 0 or ESC to cancel.", (ord("0"), 27), self.tool.run)
+        if future is None:
+            self.tool.cancel()
+            return None
         try:
-            self.tool.run()
+            future.result()
             return True
         except Exception as e:
-            parent_win.clear()
-            parent_win.addstr(0, 0, f"Error launching connection: {e}")
-            parent_win.addstr(1, 0, "Press any key to retry or 0 to cancel.")
-            parent_win.refresh()
-            key = parent_win.getch()
-            try:
-                if chr(key) == "0":
-                    return None
-            except Exception:
+            self.show_status(parent_win,
+                             f"Error launching connection: {e}",
+                             "Press any key to retry or 0 to cancel.")
+            key = self.read_key(parent_win)
+            if key in (ord("0"), -1):  # -1 (ERR) also cancels
                 return None
             return False
 
+    def get_submenu_win(self, stdscr):
+        """
+        Returns the submenu window covering the right two-thirds of stdscr, creating it
+        on first use and again only after the terminal has been resized. The window is
+        kept on the shared UI instance (like the alert window), since the tool builds a
+        new submenu every time its menu is opened.
+        """
+        h, w = stdscr.getmaxyx()
+        ui = self.tool.ui_instance
+        cached = getattr(ui, "pyficonnect_submenu_win", None)
+        if cached is None or cached[0] != (h, w):
+            alert_width = w // 3
+            submenu_win = curses.newwin(h, w - alert_width, 0, alert_width)
+            submenu_win.keypad(True)
+            ui.pyficonnect_submenu_win = cached = ((h, w), submenu_win)
+        return cached[1]
+
     def __call__(self, stdscr) -> None:
         curses.curs_set(0)
         self.stdscr = stdscr
@@ -429,34 +665,13 @@ class PyfyConnectSubmenu(BaseSubmenu):
         self.alert_queue = []  # Clear any stale alerts
         # create persistent alert window on the left one‑third
         self.setup_alert_window(stdscr)
-        h, w = stdscr.getmaxyx()
-        alert_width = w // 3
-        # create the submenu window in the remaining right two‑thirds
-        submenu_win = curses.newwin(h, w - alert_width, 0, alert_width)
-        submenu_win.keypad(True)
-        submenu_win.clear()
-        submenu_win.refresh()
-
-        # start a background thread to update alerts every second
-        self.running = True
-        import threading, time
-        def _alert_updater():
-            while self.running:
-                self.update_alert_window()
-                time.sleep(1)
-
-        updater = threading.Thread(target=_alert_updater, daemon=True)
-        updater.start()
-
-        # define the base menu
-        base_menu_items = ["Scan", "Manage", "Utils"]
         title = getattr(self.tool, "name", "PyfiConnect")
 
         while True:
-            # draw the main menu in the submenu window
-            submenu_win.clear()
-            submenu_win.refresh()
-            selection = self.show_main_menu(submenu_win, base_menu_items, title)
+            # draw the main menu in the submenu window (draw_menu paints it in one update,
+            # so no blank frame is pushed first)
+            submenu_win = self.get_submenu_win(stdscr)
+            selection = self.show_main_menu(submenu_win, self.BASE_MENU_ITEMS, title)
             if selection.lower() == "back":
                 break
             elif selection == "Scan":
@@ -465,15 +680,13 @@ class PyfyConnectSubmenu(BaseSubmenu):
                 self.connection_menu(submenu_win)
             elif selection == "Utils":
                 self.utils_menu(submenu_win)
-            # clear after processing
-            submenu_win.clear()
-            submenu_win.refresh()
 
-        # stop alert signal updates
-        self.running = False
-        updater.join(timeout=1)
         self.tool.ui_instance.unregister_active_submenu()
         self.scapy_manager.unregister_alert_callback(self.handle_alert)
+        self.close_alert_wake()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
         self.logger.debug("PyfiConnectSubmenu: Active submenu unregistered in __call__ exit.")
 
 
@@ -1,5 +1,8 @@
+import os
+import sys
 import curses
 import logging
+import select
 import socket
 import time
 import yaml
@@ -8,11 +11,21 @@ from typing import List, Any, Union
 
 from tools.pyficonnect.scapymanager import ScapyManager
 # locals
-from utils.ipc_client import IPCClient
-from tools.helpers.tool_utils import format_scan_display
+from tools.helpers.tool_utils import (
+    format_scan_display, update_yaml_value, get_all_connected_interfaces, get_available_wireless_interfaces
+)
+
+# paginated menu footer lines
+BACK_ITEM = "[0] Back"
+PAGINATION_INFO = "Pg. {page}/{pages} (n:ext, p:rev)"
 
 
 class BaseSubmenu:
+    # when set, menus wait for keys with this timeout (ms) and refresh the alert window
+    # in between (see getch_with_alerts) instead of relying on an updater thread
+    ALERT_POLL_MS = None
+    alerts_dirty = False  # set by handle_alert when ALERT_POLL_MS defers drawing to the UI thread
+
     def __init__(self, tool_instance, stdscr=None):
         """
         Base submenu for all tools.
@@ -29,6 +42,10 @@ class BaseSubmenu:
         self.scapy_manager = ScapyManager.get_instance()
         self.scapy_manager.register_alert_callback(self.handle_alert)
         self.running = True
+        self._presets_cache_src = None  # tool.presets dict the select_preset caches were built from
+        self._sorted_preset_list = []
+        self._preset_menu_items = []
+        self._alert_wake = None  # (read_fd, write_fd) pipe handle_alert uses to wake getch_with_alerts
 
     #############################################
     ##### SHARED ALERT WINDOW FOR ALL TOOLS #####
@@ -49,19 +66,27 @@ class BaseSubmenu:
             self.alert_win = None
 
     def _alert_updater(self):
-        import time
         while self.running:
             self.update_alert_window()
             time.sleep(1)
 
+    def send_ipc(self, message: dict) -> dict:
+        """
+        Sends a message over the tool's IPCClient (see Tool.send_ipc).
+        """
+        return self.tool.send_ipc(message)
+
     ###############################
     ##### BASIC MENU CREATION #####
     ###############################
-    def draw_menu(self, parent_win, title: str, menu_items: List[str]) -> Any:
-        parent_win.clear()
+    def draw_menu(self, parent_win, title: str, menu_items: List[str], content_width: int = None) -> Any:
+        # erase() rather than clear(): curses then only sends the cells that changed
+        # (e.g. the page of items) instead of repainting the whole terminal
+        parent_win.erase()
         h, w = parent_win.getmaxyx()
         box_height = len(menu_items) + 4
-        content_width = max(len(title), *(len(item) for item in menu_items))
+        if content_width is None:
+            content_width = max(len(title), max(map(len, menu_items), default=0))
         # Limit box width to available width with some margin
         box_width = min(content_width + 4, w - 2)
         start_y = (h - box_height) // 2
@@ -73,44 +98,138 @@ class BaseSubmenu:
         menu_win.addstr(1, (box_width - len(title)) // 2, title, curses.A_BOLD)
         for idx, item in enumerate(menu_items):
             menu_win.addstr(2 + idx, 2, item)
-        menu_win.refresh()
+        parent_win.noutrefresh()
+        menu_win.noutrefresh()
+        curses.doupdate()
         return menu_win
 
     def draw_paginated_menu(self, parent_win, title: str, menu_items: List[str]) -> str:
+        index = self.draw_paginated_menu_indexed(parent_win, title, menu_items)
+        if index is None:
+            return self.BACK_OPTION
+        return menu_items[index]
+
+    def draw_paginated_menu_indexed(self, parent_win, title: str, menu_items: List[str]) -> Union[int, None]:
+        """
+        Same menu as draw_paginated_menu, but returns the index of the selected item in
+        menu_items (None for back), so callers can map a selection to their own data
+        without comparing strings.
+        """
         h, w = parent_win.getmaxyx()
         max_items = max(h - 6, 1)
         total_items = len(menu_items)
         total_pages = (total_items + max_items - 1) // max_items
         current_page = 0
+        # page index -> (page_items, display_items, content_width); menu_items does not change during the call
+        page_cache = {}
+        drawn_page = None
+        menu_win = None
 
         while True:
-            start_index = current_page * max_items
-            end_index = start_index + max_items
-            page_items = menu_items[start_index:end_index]
-            display_items = [f"[{i + 1}] {option}" for i, option in enumerate(page_items)]
-            if total_pages > 1:
-                pagination_info = f"Pg. {current_page + 1}/{total_pages} (n:ext, p:rev)"
-                display_items.append(pagination_info)
-            display_items.append("[0] Back")
-            menu_win = self.draw_menu(parent_win, title, display_items)
-            key = menu_win.getch()
+            cached = page_cache.get(current_page)
+            if cached is None:
+                start_index = current_page * max_items
+                page_items = menu_items[start_index:start_index + max_items]
+                display_items = [f"[{i + 1}] {option}" for i, option in enumerate(page_items)]
+                if total_pages > 1:
+                    display_items.append(PAGINATION_INFO.format(page=current_page + 1, pages=total_pages))
+                display_items.append(BACK_ITEM)
+                content_width = max(len(title), max(map(len, display_items)))
+                cached = page_cache[current_page] = (page_items, display_items, content_width)
+            page_items, display_items, content_width = cached
+            # the menu window stays on screen across keys; only a page change redraws it
+            if current_page != drawn_page:
+                menu_win = self.draw_menu(parent_win, title, display_items, content_width)
+                drawn_page = current_page
+            key = self.getch_with_alerts(menu_win)
+            if key == curses.KEY_RESIZE:
+                # the page size follows the window height: re-paginate around the first item
+                # on screen, drop the cached pages and repaint even though the page is the same
+                first_index = current_page * max_items
+                h, w = parent_win.getmaxyx()
+                max_items = max(h - 6, 1)
+                total_pages = (total_items + max_items - 1) // max_items
+                current_page = first_index // max_items
+                page_cache.clear()
+                drawn_page = None
+                parent_win.touchwin()
+                continue
             try:
                 ch = chr(key)
             except Exception:
                 continue
 
-            if ch.lower() == 'n' and current_page < total_pages - 1:
-                current_page += 1
-                continue
-            elif ch.lower() == 'p' and current_page > 0:
-                current_page -= 1
+            if ch.lower() in ('n', 'p'):
+                # apply paging keys already queued (e.g. key repeat) before redrawing once
+                menu_win.nodelay(True)
+                try:
+                    while True:
+                        if ch.lower() == 'n' and current_page < total_pages - 1:
+                            current_page += 1
+                        elif ch.lower() == 'p' and current_page > 0:
+                            current_page -= 1
+                        key = menu_win.getch()
+                        if key == -1:
+                            break
+                        ch = chr(key) if 0 <= key < 256 else ""
+                        if ch.lower() not in ('n', 'p'):
+                            # anything else, KEY_RESIZE included, is handled by the outer loop
+                            curses.ungetch(key)
+                            break
+                finally:
+                    menu_win.nodelay(False)
                 continue
             elif ch == '0':
-                return self.BACK_OPTION
+                return None
             elif ch.isdigit():
                 selection = int(ch)
                 if 1 <= selection <= len(page_items):
-                    return page_items[selection - 1]
+                    return current_page * max_items + selection - 1
+
+    def getch_with_alerts(self, win) -> int:
+        """
+        Waits for a key on win. With ALERT_POLL_MS set, the curses thread sleeps in
+        select() on stdin and a wake-up pipe that handle_alert writes to, so it only
+        wakes for a key or a new alert. While alerts are on screen the wait is capped
+        at ALERT_POLL_MS so their age counters keep ticking; the alert window is
+        redrawn from this (the curses) thread. Otherwise this is a plain blocking getch().
+        """
+        if not self.ALERT_POLL_MS:
+            return win.getch()
+        if self._alert_wake is None:
+            self._alert_wake = os.pipe()
+            os.set_blocking(self._alert_wake[1], False)
+        wake_fd = self._alert_wake[0]
+        # non-blocking getch() first: curses may already hold queued or ungetch()'d keys
+        win.timeout(0)
+        try:
+            while True:
+                key = win.getch()
+                if key != -1:
+                    return key
+                alerts_shown = bool(getattr(self.tool.ui_instance, "global_alerts", None))
+                timeout = self.ALERT_POLL_MS / 1000 if alerts_shown else None
+                ready, _, _ = select.select([sys.stdin, wake_fd], [], [], timeout)
+                if sys.stdin in ready:
+                    continue
+                if wake_fd in ready:
+                    os.read(wake_fd, 512)
+                if self.alerts_dirty or alerts_shown:
+                    self.alerts_dirty = False
+                    self.update_alert_window()
+        finally:
+            win.timeout(-1)
+
+    def close_alert_wake(self) -> None:
+        """
+        Closes the getch_with_alerts wake-up pipe; called when the submenu exits, since
+        the tool builds a new submenu (and pipe) every time its menu is opened.
+        """
+        if self._alert_wake is None:
+            return
+        wake_fds, self._alert_wake = self._alert_wake, None
+        for fd in wake_fds:
+            os.close(fd)
 
     #####################################
     ##### MENU OPTIONS & ATTRIBUTES #####
@@ -134,7 +253,31 @@ class BaseSubmenu:
         self.alert_win = self.tool.ui_instance.alert_win
 
     def handle_alert(self, alert_data):
+        """
+        Alert callback registered with the ScapyManager. Accepts a single alert or a
+        batch (list) of alerts published from one scan pass; a batch is fanned out into
+        the global alert list and the alert window is redrawn once.
+        """
         self.logger.info("Received alert: %s", alert_data)
+        alerts = alert_data if isinstance(alert_data, list) else [alert_data]
+
+        # Append to the global alert list.
+        if not hasattr(self.tool.ui_instance, "global_alerts"):
+            self.tool.ui_instance.global_alerts = []
+        for alert in alerts:
+            self.tool.ui_instance.global_alerts.append(self._format_alert(alert))
+        if self.ALERT_POLL_MS:
+            # drawn by the curses thread, woken out of getch_with_alerts
+            self.alerts_dirty = True
+            if self._alert_wake is not None:
+                try:
+                    os.write(self._alert_wake[1], b"\0")
+                except BlockingIOError:
+                    pass  # pipe already full, the curses thread is going to wake anyway
+            return
+        self.display_alert(self.tool.ui_instance.global_alerts)
+
+    def _format_alert(self, alert_data) -> dict:
         if hasattr(alert_data, "to_dict"):
             alert_dict = alert_data.to_dict()
             created_at = alert_data.created_at
@@ -149,25 +292,18 @@ class BaseSubmenu:
             ssid = alert_dict.get("data", {}).get("ssid", "Unknown")
             elapsed = int(time.time() - created_at)
             message = f"{ssid} ({elapsed}s)"
-            formatted_alert = {
+            return {
                 "action": "NETWORK_FOUND",
                 "message": message,
                 "ssid": ssid,
                 "created_at": created_at,
                 "expiration": time.time() + 120
             }
-        else:
-            formatted_alert = {
-                "message": str(alert_dict),
-                "created_at": created_at,
-                "expiration": time.time() + 120
-            }
-
-        # Append to the global alert list.
-        if not hasattr(self.tool.ui_instance, "global_alerts"):
-            self.tool.ui_instance.global_alerts = []
-        self.tool.ui_instance.global_alerts.append(formatted_alert)
-        self.display_alert(self.tool.ui_instance.global_alerts)
+        return {
+            "message": str(alert_dict),
+            "created_at": created_at,
+            "expiration": time.time() + 120
+        }
 
     def update_alert_window(self):
         if not self.alert_win:
@@ -188,19 +324,7 @@ class BaseSubmenu:
                 messages.append(f"{ssid} ({elapsed}s)")
             else:
                 messages.append(alert.get("message", "Unknown alert"))
-        final_message = "\n".join(messages)
-        h, w = self.alert_win.getmaxyx()
-        self.alert_win.erase()
-        self.alert_win.box()
-        lines = final_message.splitlines()
-        if len(lines) > (h - 2):
-            lines = lines[-(h - 2):]
-        for row, line in enumerate(lines, start=1):
-            try:
-                self.alert_win.addstr(row, 2, line[:w - 4])
-            except curses.error:
-                pass
-        self.alert_win.refresh()
+        self._update_alert_window_from_message("\n".join(messages))
 
     def display_alert(self, alerts: list):
         formatted_messages = []
@@ -232,35 +356,59 @@ class BaseSubmenu:
         self.update_alert_window()
 
     def _update_alert_window_from_message(self, message: str):
+        """
+        Draws message (one alert per line, newest last) into the alert window. Only rows
+        whose text differs from the last draw into the same window are rewritten; the
+        window is erased and boxed again only when it is new or was resized. The last
+        draw is kept on the shared UI instance since every submenu draws into its window.
+        """
         if not self.alert_win:
             return
 
         h, w = self.alert_win.getmaxyx()
-        self.alert_win.erase()
-        self.alert_win.box()
-        lines = message.splitlines() or [message]
+        lines = message.splitlines()
         if len(lines) > (h - 2):
             lines = lines[-(h - 2):]
-        for row, line in enumerate(lines, start=1):
+        ui = self.tool.ui_instance
+        last_win, last_size, last_lines = getattr(ui, "alert_win_drawn", (None, None, None))
+        if last_win is self.alert_win and last_size == (h, w):
+            if lines == last_lines:
+                return
+        else:
+            self.alert_win.erase()
+            self.alert_win.box()
+            last_lines = []
+        for row in range(1, h - 1):
+            line = lines[row - 1] if row - 1 < len(lines) else ""
+            if line == (last_lines[row - 1] if row - 1 < len(last_lines) else ""):
+                continue
             try:
-                self.alert_win.addstr(row, 2, line[:w - 4])
+                # pad to the box interior so a shorter line overwrites the old one
+                self.alert_win.addstr(row, 2, line[:w - 4].ljust(w - 4))
             except curses.error:
                 pass
-        self.alert_win.refresh()
+        ui.alert_win_drawn = (self.alert_win, (h, w), lines)
+        self.alert_win.noutrefresh()
+        curses.doupdate()
 
     #############################
     ##### MAIN MENU OPTIONS #####
     #############################
+    def available_interfaces(self) -> List[str]:
+        """
+        Returns the wlan interfaces from the tool's config.yaml that are currently present.
+        """
+        connected = get_available_wireless_interfaces(self.logger)
+        # get config.yaml interfaces
+        interfaces = self.tool.interfaces.get("wlan", [])
+        # filter found interfaces and display only connected ones
+        return [iface.get("name") for iface in interfaces if iface.get("name") in connected]
+
     def select_interface(self, parent_win) -> Union[str, None]:
-        from tools.helpers.tool_utils import get_available_wireless_interfaces
         while True:
-            connected = get_available_wireless_interfaces(self.logger)
-            # get config.yaml interfaces
-            interfaces = self.tool.interfaces.get("wlan", [])
-            # filter found interfaces and display only connected ones
-            available = [iface.get("name") for iface in interfaces if iface.get("name") in connected]
+            available = self.available_interfaces()
             if not available:
-                parent_win.clear()
+                parent_win.erase()
                 parent_win.addstr(0, 0,
                                   f"No interfaces from {self.tool.config_file} found."
                                   f"\n\nTip: Use the Utils submenu to edit tool-specific configs.")
@@ -283,28 +431,29 @@ class BaseSubmenu:
         :param parent_win:
         :return:
         """
-        while True:
-            presets = self.tool.presets
-            if not presets:
-                parent_win.clear()
-                parent_win.addstr(0, 0, "No presets available!")
-                parent_win.refresh()
-                parent_win.getch()
-                return self.BACK_OPTION
+        presets = self.tool.presets
+        if not presets:
+            parent_win.erase()
+            parent_win.addstr(0, 0, "No presets available!")
+            parent_win.refresh()
+            parent_win.getch()
+            return self.BACK_OPTION
+        # sorted presets and their labels are rebuilt only when reload_config() replaced the dict
+        if self._presets_cache_src is not presets:
             try:
                 sorted_keys = sorted(presets.keys(), key=lambda k: int(k))
             except Exception:
                 sorted_keys = sorted(presets.keys())
-            preset_list = [(key, presets[key]) for key in sorted_keys]
-            menu_items = [preset.get("description", "No description") for _, preset in preset_list]
-            selection = self.draw_paginated_menu(parent_win, "Select Scan Preset", menu_items)
-            if selection == self.BACK_OPTION:
-                return self.BACK_OPTION
-            for key, preset in preset_list:
-                if preset.get("description", "No description") == selection:
-                    self.logger.debug("Selected preset: %s", preset)
-                    return preset
-            # if nothing matches, loop again
+            self._sorted_preset_list = [(key, presets[key]) for key in sorted_keys]
+            self._preset_menu_items = [preset.get("description", "No description")
+                                       for _, preset in self._sorted_preset_list]
+            self._presets_cache_src = presets
+        index = self.draw_paginated_menu_indexed(parent_win, "Select Scan Preset", self._preset_menu_items)
+        if index is None:
+            return self.BACK_OPTION
+        preset = self._sorted_preset_list[index][1]
+        self.logger.debug("Selected preset: %s", preset)
+        return preset
 
     def pre_launch_hook(self, parent_win) -> bool:
         """
@@ -333,7 +482,7 @@ class BaseSubmenu:
                 return
             self.tool.selected_preset = selected_preset
             self.tool.preset_description = selected_preset.get("description", "")
-            parent_win.clear()
+            parent_win.erase()
             confirm_msg = f"Launching scan with preset: {self.tool.preset_description}"
             parent_win.addstr(0, 0, confirm_msg)
             parent_win.refresh()
@@ -342,7 +491,7 @@ class BaseSubmenu:
                 self.tool.run()
                 break  # Scan launched successfully; exit loop.
             except Exception as e:
-                parent_win.clear()
+                parent_win.erase()
                 parent_win.addstr(0, 0, f"Error launching scan: {e}")
                 parent_win.refresh()
                 parent_win.getch()
@@ -355,13 +504,12 @@ class BaseSubmenu:
         :return: None
         """
         while True:
-            client = IPCClient()
             tool_name = getattr(self.tool, 'name', 'tool')
             message = {"action": "GET_SCANS", "tool": tool_name}
             self.logger.debug("view_scans: Sending GET_SCANS for tool '%s'", tool_name)
-            response = client.send(message)
+            response = self.send_ipc(message)
             scans = response.get("scans", [])
-            parent_win.clear()
+            parent_win.erase()
             if not scans:
                 parent_win.addstr(0, 0, "No active scans found!")
                 parent_win.refresh()
@@ -378,7 +526,7 @@ class BaseSubmenu:
                 continue
             selected_scan = scans[selected_index]
             while True:
-                parent_win.clear()
+                parent_win.erase()
                 secondary_menu = ["Swap", "Stop", "Cancel"]
                 sec_menu_items = [f"[{i + 1}] {item}" for i, item in enumerate(secondary_menu)]
                 sec_menu_win = self.draw_menu(parent_win, "Selected Scan Options", sec_menu_items)
@@ -387,7 +535,7 @@ class BaseSubmenu:
                     ch = chr(key)
                 except Exception:
                     ch = ""
-                parent_win.clear()
+                parent_win.erase()
                 if ch == "1":
                     new_title = f"{self.tool.selected_interface}_{self.tool.selected_preset.get('description', '')}"
                     swap_message = {
@@ -396,7 +544,7 @@ class BaseSubmenu:
                         "pane_id": selected_scan.get("pane_id"),
                         "new_title": new_title
                     }
-                    swap_response = client.send(swap_message)
+                    swap_response = self.send_ipc(swap_message)
                     if swap_response.get("status", "").startswith("SWAP_SCAN_OK"):
                         parent_win.addstr(0, 0, "Scan swapped successfully!")
                     else:
@@ -411,7 +559,7 @@ class BaseSubmenu:
                         "tool": tool_name,
                         "pane_id": selected_scan.get("pane_id")
                     }
-                    stop_response = client.send(stop_message)
+                    stop_response = self.send_ipc(stop_message)
                     if stop_response.get("status", "").startswith("STOP_SCAN_OK"):
                         parent_win.addstr(0, 0, "Scan stopped successfully!")
                     else:
@@ -422,14 +570,11 @@ class BaseSubmenu:
                     break
                 else:
                     break  # Cancel or unrecognized; exit secondary loop.
-            parent_win.clear()
+            parent_win.erase()
             parent_win.addstr(0, 0, "Press any key to refresh scans menu, or 0 to go back.")
             parent_win.refresh()
             key = parent_win.getch()
-            try:
-                if chr(key) == "0":
-                    return
-            except Exception:
+            if key in (ord("0"), -1):  # -1 (ERR) also cancels
                 return
 
     #################################
@@ -454,8 +599,6 @@ class BaseSubmenu:
         """
         config_options = ["Create Scan Profile", "Edit Scan Profile", "Edit Interfaces"]
         while True:
-            parent_win.clear()
-            parent_win.refresh()
             sub_selection = self.draw_paginated_menu(parent_win, "Setup Configs", config_options)
             if sub_selection.lower() == self.BACK_OPTION:
                 # User selected 'back' so exit the nested submenu.
@@ -466,8 +609,6 @@ class BaseSubmenu:
                 self.edit_preset_profile_menu(parent_win)
             elif sub_selection == "Edit Interfaces":
                 self.edit_interfaces_menu(parent_win)
-            parent_win.clear()
-            parent_win.refresh()
 
     def utils_menu(self, parent_win) -> None:
         """
@@ -484,8 +625,6 @@ class BaseSubmenu:
         """
         menu_options = self.get_utils_menu_options()
         while True:
-            parent_win.clear()
-            parent_win.refresh()
             selection = self.draw_paginated_menu(parent_win, "Utils", menu_options)
             if selection.lower() == self.BACK_OPTION:
                 break
@@ -495,8 +634,6 @@ class BaseSubmenu:
                 self.open_results_webserver(parent_win)
             elif selection == "Kill Window":
                 self.kill_background_window_menu(parent_win)
-            parent_win.clear()
-            parent_win.refresh()
 
     def create_preset_profile_menu(self, parent_win) -> None:
         """
@@ -511,7 +648,7 @@ class BaseSubmenu:
             with defaults_path.open("r") as f:
                 defaults_data = yaml.safe_load(f)
         except Exception as e:
-            parent_win.clear()
+            parent_win.erase()
             parent_win.addstr(0, 0, f"Error loading defaults.yaml: {e}")
             parent_win.refresh()
             parent_win.getch()
@@ -519,7 +656,7 @@ class BaseSubmenu:
 
         default_profile = defaults_data.get("scan_profile", {})
         if not default_profile:
-            parent_win.clear()
+            parent_win.erase()
             parent_win.addstr(0, 0, "No scan profile defaults found in defaults.yaml.")
             parent_win.refresh()
             parent_win.getch()
@@ -532,7 +669,7 @@ class BaseSubmenu:
             default_value = opt_data.get("value", "")
             # nested loop to avoid tiling
             while True:
-                parent_win.clear()
+                parent_win.erase()
                 if default_value is None:
                     prompt = f"Enable option '{opt_key}'? (t/f, default: f): "
                 else:
@@ -549,7 +686,7 @@ class BaseSubmenu:
                     user_input = ""
                 curses.noecho()
                 if user_input == "0":
-                    parent_win.clear()
+                    parent_win.erase()
                     parent_win.addstr(0, 0, "Profile creation cancelled.")
                     parent_win.refresh()
                     parent_win.getch()
@@ -564,7 +701,7 @@ class BaseSubmenu:
 
         # prompt for profile ID
         while True:
-            parent_win.clear()
+            parent_win.erase()
             parent_win.addstr(0, 0, "Enter a name/ID for this new profile (leave blank to cancel):")
             parent_win.refresh()
             curses.echo()
@@ -574,7 +711,7 @@ class BaseSubmenu:
                 profile_id = ""
             curses.noecho()
             if profile_id == "":
-                parent_win.clear()
+                parent_win.erase()
                 parent_win.addstr(0, 0, "No profile ID provided. Cancelling.")
                 parent_win.refresh()
                 parent_win.getch()
@@ -584,7 +721,7 @@ class BaseSubmenu:
 
         # preview and confirmation loop
         while True:
-            parent_win.clear()
+            parent_win.erase()
             parent_win.addstr(0, 0, f"New Profile ({profile_id}):")
             row = 1
             for key, value in new_profile.items():
@@ -593,7 +730,7 @@ class BaseSubmenu:
                         parent_win.addstr(row, 0, "Press any key to continue preview...")
                         parent_win.refresh()
                         parent_win.getch()
-                        parent_win.clear()
+                        parent_win.erase()
                         row = 1
                         parent_win.addstr(0, 0, f"New Profile ({profile_id}):")
                     parent_win.addstr(row, 0, f"{key}: {value}")
@@ -601,15 +738,15 @@ class BaseSubmenu:
             parent_win.addstr(row, 0, "Press 1 to Save, 2 to Cancel, or 3 to Re-edit attributes:")
             parent_win.refresh()
             choice = parent_win.getch()
-            if chr(choice).lower() == "1":
+            if choice == ord("1"):
                 break  # save
-            elif chr(choice).lower() == "2":
-                parent_win.clear()
+            elif choice == ord("2"):
+                parent_win.erase()
                 parent_win.addstr(0, 0, "Profile creation cancelled.")
                 parent_win.refresh()
                 parent_win.getch()
                 return
-            elif chr(choice) == "3":
+            elif choice == ord("3"):
                 # restart the creation process
                 return self.create_preset_profile_menu(parent_win)
             # else loop back for confirmation
@@ -622,13 +759,14 @@ class BaseSubmenu:
             next_key = "1"
         filtered_profile = {k: v for k, v in new_profile.items() if v not in ("", None)}
         self.tool.presets[next_key] = {"description": profile_id, "options": filtered_profile}
+        self._presets_cache_src = None  # edited in place; rebuild the select_preset caches
         try:
             self.tool.update_presets_in_config(self.tool.presets)
-            parent_win.clear()
+            parent_win.erase()
             self.tool.reload_config()
             parent_win.addstr(0, 0, "New profile created and saved. Press any key to continue...")
         except Exception as e:
-            parent_win.clear()
+            parent_win.erase()
             parent_win.addstr(0, 0, f"Error saving profile: {e}")
         parent_win.refresh()
         parent_win.getch()
@@ -640,7 +778,7 @@ class BaseSubmenu:
         """
         presets_dict = self.tool.presets
         if not presets_dict:
-            parent_win.clear()
+            parent_win.erase()
             parent_win.addstr(0, 0, "No presets available to edit!")
             parent_win.refresh()
             parent_win.getch()
@@ -655,8 +793,6 @@ class BaseSubmenu:
 
         # Outer loop: select a preset to edit.
         while True:
-            parent_win.clear()
-            parent_win.refresh()
             selection = self.draw_paginated_menu(parent_win, "Edit Profile", menu_items)
             if selection == self.BACK_OPTION:
                 return
@@ -668,7 +804,7 @@ class BaseSubmenu:
                     selected_preset = preset
                     break
             if not selected_preset:
-                parent_win.clear()
+                parent_win.erase()
                 parent_win.addstr(0, 0, "Selected preset not found!")
                 parent_win.refresh()
                 parent_win.getch()
@@ -677,8 +813,6 @@ class BaseSubmenu:
             options = selected_preset.get("options", {}).copy()
             # inner loop: editing
             while True:
-                parent_win.clear()
-                parent_win.refresh()
                 option_items = [f"{k}: {v}" for k, v in options.items()]
                 option_items.append("Finish Editing")
                 sub_selection = self.draw_paginated_menu(parent_win, "Select Option to Edit", option_items)
@@ -690,7 +824,7 @@ class BaseSubmenu:
                     continue
                 # new value prompt
                 while True:
-                    parent_win.clear()
+                    parent_win.erase()
                     prompt = f"Enter new value for {key_to_edit} (current: {options.get(key_to_edit)}):"
                     parent_win.addstr(0, 0, prompt)
                     parent_win.addstr(2, 0, "Press [Enter] to keep current value or type a new value.")
@@ -711,7 +845,7 @@ class BaseSubmenu:
                     break  # proceed to next option
 
             # after editing, prompt confirm changes
-            parent_win.clear()
+            parent_win.erase()
             parent_win.addstr(0, 0, f"Current profile description: {selected_preset.get('description', '')}")
             parent_win.addstr(1, 0, "Enter new description (or press Enter to keep current):")
             parent_win.refresh()
@@ -724,7 +858,7 @@ class BaseSubmenu:
             if new_desc == "":
                 new_desc = selected_preset.get("description", "")
 
-            parent_win.clear()
+            parent_win.erase()
             parent_win.addstr(0, 0, "Review updated profile:")
             row = 1
             parent_win.addstr(row, 0, f"Description: {new_desc}")
@@ -736,26 +870,27 @@ class BaseSubmenu:
                     parent_win.addstr(row, 0, "Press any key to continue...")
                     parent_win.refresh()
                     parent_win.getch()
-                    parent_win.clear()
+                    parent_win.erase()
                     row = 0
             parent_win.addstr(row, 0, "Press 'y' to confirm changes, any other key to cancel.")
             parent_win.refresh()
             confirmation = parent_win.getch()
-            if chr(confirmation).lower() == 'y':
+            if confirmation in (ord('y'), ord('Y')):
                 self.tool.presets[selected_key] = {"description": new_desc, "options": options}
+                self._presets_cache_src = None  # edited in place; rebuild the select_preset caches
                 try:
                     self.tool.reload_config()
-                    parent_win.clear()
+                    parent_win.erase()
                     parent_win.addstr(0, 0, "Profile updated and saved. Press any key to continue...")
                     self.tool.reload_config()
                 except Exception as e:
-                    parent_win.clear()
+                    parent_win.erase()
                     parent_win.addstr(0, 0, f"Error saving profile: {e}")
                 parent_win.refresh()
                 parent_win.getch()
                 return
             else:
-                parent_win.clear()
+                parent_win.erase()
                 parent_win.addstr(0, 0, "Profile edit cancelled. Press any key to re-select a profile.")
                 parent_win.refresh()
                 parent_win.getch()
@@ -781,7 +916,7 @@ class BaseSubmenu:
         finally:
             s.close()
         url = f"http://{local_ip}:{port}/{self.tool.name}"
-        parent_win.clear()
+        parent_win.erase()
         parent_win.addstr(0, 0, f"Webserver started at: {url}")
         parent_win.addstr(1, 0, "Press any key to continue...")
         parent_win.refresh()
@@ -802,13 +937,12 @@ class BaseSubmenu:
         :return: None
         """
         while True:
-            client = IPCClient()
             tool_name = getattr(self.tool, 'name', 'tool')
             message = {"action": "GET_SCANS", "tool": tool_name}
             self.logger.debug("kill_windows_menu: Sending GET_SCANS for tool '%s'", tool_name)
-            response = client.send(message)
+            response = self.send_ipc(message)
             scans = response.get("scans", [])
-            parent_win.clear()
+            parent_win.erase()
             if not scans:
                 parent_win.addstr(0, 0, "No active background windows found!")
                 parent_win.refresh()
@@ -823,12 +957,12 @@ class BaseSubmenu:
             except ValueError:
                 self.logger.error("kill_windows_menu: Selected option not found in list.")
                 continue
-            parent_win.clear()
+            parent_win.erase()
             if selected_index == 0:
                 for scan in scans:
                     pane_id = scan.get("pane_id")
                     kill_message = {"action": "KILL_WINDOW", "tool": tool_name, "pane_id": pane_id}
-                    kill_response = client.send(kill_message)
+                    kill_response = self.send_ipc(kill_message)
                     if not kill_response.get("status", "").startswith("KILL_WINDOW_OK"):
                         error_text = kill_response.get("error", "Unknown error")
                         self.logger.error("Error killing window (pane %s): %s", pane_id, error_text)
@@ -837,7 +971,7 @@ class BaseSubmenu:
                 scan = scans[selected_index - 1]
                 pane_id = scan.get("pane_id")
                 kill_message = {"action": "KILL_WINDOW", "tool": tool_name, "pane_id": pane_id}
-                kill_response = client.send(kill_message)
+                kill_response = self.send_ipc(kill_message)
                 if kill_response.get("status", "").startswith("KILL_WINDOW_OK"):
                     parent_win.addstr(0, 0, f"Window for pane {pane_id} killed successfully!")
                 else:
@@ -845,14 +979,11 @@ class BaseSubmenu:
                     parent_win.addstr(0, 0, f"Error killing window for pane {pane_id}: {error_text}")
             parent_win.refresh()
             curses.napms(1500)
-            parent_win.clear()
+            parent_win.erase()
             parent_win.addstr(0, 0, "Press any key to refresh kill windows menu, or 0 to go back.")
             parent_win.refresh()
             key = parent_win.getch()
-            try:
-                if chr(key) == "0":
-                    return
-            except Exception:
+            if key in (ord("0"), -1):  # -1 (ERR) also cancels
                 return
 
     def edit_interfaces_menu(self, parent_win) -> None:
@@ -863,8 +994,6 @@ class BaseSubmenu:
         iterates over its attributes and prompts the user to change each value (or leave it unchanged),
         then saves the updated configuration.
         """
-        from tools.helpers.tool_utils import update_yaml_value, get_all_connected_interfaces
-        import yaml
         while True:
             config_file = self.tool.config_file
             try:
@@ -876,7 +1005,7 @@ class BaseSubmenu:
 
             interfaces = config.get("interfaces", {})
             if not interfaces:
-                parent_win.clear()
+                parent_win.erase()
                 parent_win.addstr(0, 0, "No interfaces found in configuration.")
                 parent_win.refresh()
                 parent_win.getch()
@@ -937,7 +1066,7 @@ class BaseSubmenu:
                 chosen_interface = interface_config
                 key_path_prefix = ["interfaces", selected_key]
             else:
-                parent_win.clear()
+                parent_win.erase()
                 parent_win.addstr(0, 0, "Interfaces format unrecognized.")
                 parent_win.refresh()
                 parent_win.getch()
@@ -982,7 +1111,6 @@ class BaseSubmenu:
         and updates the configuration file accordingly. Prompts for description, locked (true/false),
         and name. When prompting for the interface name, it displays the currently connected interfaces.
         """
-        from tools.helpers.tool_utils import update_yaml_value, get_available_wireless_interfaces
         config_file = self.tool.config_file
 
         # load current config
@@ -1072,10 +1200,9 @@ class BaseSubmenu:
             self.logger.error(f"Error updating configuration file {config_file}: {e}")
 
     def show_main_menu(self, submenu_win, base_menu_items: List[str], title: str) -> str:
-        client = IPCClient()
         while True:
             state_message = {"action": "COPY_MODE", "copy_mode_action": "get_copy_mode_state"}
-            state_response = client.send(state_message)
+            state_response = self.send_ipc(state_message)
             scrolling_state = False
             if state_response.get("status") == "COPY_MODE_STATE":
                 scrolling_state = state_response.get("copy_mode_enabled", False)
@@ -1094,18 +1221,20 @@ class BaseSubmenu:
                 return "back"
             elif selection.startswith("Scrolling"):
                 toggle_message = {"action": "COPY_MODE", "copy_mode_action": "toggle"}
-                toggle_response = client.send(toggle_message)
+                toggle_response = self.send_ipc(toggle_message)
                 if toggle_response.get("status", "").startswith("COPY_MODE"):
                     new_state = toggle_response.get("copy_mode_enabled", False)
-                    submenu_win.clear()
+                    submenu_win.erase()
                     submenu_win.addstr(0, 0, f"Scrolling {'enabled' if new_state else 'disabled'}!")
-                    submenu_win.refresh()
+                    submenu_win.noutrefresh()
+                    curses.doupdate()
                     curses.napms(1500)
                 else:
                     error_text = toggle_response.get("error", "Unknown error")
-                    submenu_win.clear()
+                    submenu_win.erase()
                     submenu_win.addstr(0, 0, f"Error toggling scrolling: {error_text}")
-                    submenu_win.refresh()
+                    submenu_win.noutrefresh()
+                    curses.doupdate()
                     curses.napms(1500)
                 continue
             else:
@@ -1155,8 +1284,6 @@ class BaseSubmenu:
         # Create a submenu window for tool-specific content in the remaining space.
         submenu_win = curses.newwin(h, w - alert_width, 0, alert_width)
         submenu_win.keypad(True)
-        submenu_win.clear()
-        submenu_win.refresh()
 
         base_menu_items = ["Launch Scan", "Utils"]
         title = getattr(self.tool, "name", "Menu")
@@ -1169,13 +1296,12 @@ class BaseSubmenu:
                 self.launch_scan(submenu_win)
             elif selection == "Utils":
                 self.utils_menu(submenu_win)
-            # Clear only the submenu window so that the alert window remains intact.
-            submenu_win.clear()
-            submenu_win.refresh()
+            # no clear here: show_main_menu redraws the submenu window once on its next pass
             alerts = self.tool.ui_instance.alerts.get(self.tool.name, [])
             self.display_alert(alerts)
 
         self.tool.ui_instance.unregister_active_submenu()
+        self.close_alert_wake()
         self.logger.debug("Active submenu unregistered in __call__ exit.")
 
 
@@ -19,6 +19,7 @@ from tools.helpers.autobpf import run_autobpf
 from tools.helpers.tool_utils import get_network_from_interface
 from utils.ipc_callback import get_shared_callback_socket
 from utils.ipc_client import IPCClient
+from utils.helper import get_published_socket_path
 
 
 class Tool:
@@ -128,6 +129,24 @@ class Tool:
     #############################
     ##### CORE IPC HANDLING #####
     #############################
+    def send_ipc(self, message: dict) -> dict:
+        """
+        Sends a message over the tool's IPCClient. If the send fails and the IPC server
+        has since published a new socket path, the client is recreated once for that
+        path and the message is resent.
+        """
+        response = self.client.send(message)
+        if "error" in response:
+            try:
+                socket_path = get_published_socket_path()
+            except OSError:
+                return response
+            if socket_path != self.client.socket_path:
+                self.logger.debug("IPC socket moved to %s; reconnecting.", socket_path)
+                self.client = IPCClient(socket_path)
+                response = self.client.send(message)
+        return response
+
     def run_to_ipc(self, cmd_dict: dict):
         """
         Launch the scan command in a background pane via IPC.
@@ -161,7 +180,7 @@ class Tool:
             "callback_socket": self.callback_socket,
         }
 
-        response = self.client.send(ipc_message)
+        response = self.send_ipc(ipc_message)
 
         if isinstance(response, dict) and response.get("status", "").startswith("SEND_SCAN_OK"):
             pane_id = response.get("pane_id")